@@ -19,6 +19,7 @@ from clingo import (
 from merrinasp.theory.language import THEORY_LANGUAGE, rewrite
 from merrinasp.theory.propagator import LpPropagator
 from merrinasp.theory.lra.models import AVAILABLE_LPSOLVERS
+from merrinasp.theory.lra.scheduler import AVAILABLE_POLICIES, Policy
 
 
 
@@ -33,9 +34,27 @@ class Application:
         self.propagator: LpPropagator | None = None
         self.lpsolver: str = 'glpk'
         self.lp_epsilon: float = 10**-3
+        self.lp_propagation: int = 0
+        self.partial_exists: int = 0
+        self.model_pool: int = 0
+        self.batch_partitions: int = 0
+        self.check_policy: Policy = 'eager'
+        self.check_parameter: float = 0
         self.show_lpassignments_flag: Flag = Flag(False)
         self.continous_assignment: dict[str, float] | None = None
         self.lazy_mode: Flag = Flag(False)
+        self.adaptive_watches: Flag = Flag(False)
+        self.share_conflicts: Flag = Flag(False)
+        self.lock_nogoods: Flag = Flag(True)
+        self.minimize_nogoods: Flag = Flag(False)
+        self.partition_templates: Flag = Flag(False)
+        self.decompose: Flag = Flag(False)
+        self.nullspace_presolve: Flag = Flag(False)
+        self.batch_forall: Flag = Flag(False)
+        self.dualize_forall: Flag = Flag(False)
+        self.witness_store: Flag = Flag(False)
+        self.incremental_check: Flag = Flag(False)
+        self.symmetric_partitions: Flag = Flag(False)
         self.strict_forall: Flag = Flag(False)
 
     # --------------------------------------------------------------------------
@@ -50,6 +69,36 @@ class Application:
                     f"   <arg>: {{ {', '.join(AVAILABLE_LPSOLVERS)} }} (default lp-solver=glpk)",
                     self.parse_lp_solver_option)
 
+        options.add(group, "lp-propagation",
+                    "Propagate unassigned linear constraints with at most <arg> LP calls\n" +
+                    "per partition and propagation step (default lp-propagation=0)",
+                    self.parse_lp_propagation_option)
+
+        options.add(group, "partial-exists",
+                    "Check the exists constraints of partially assigned partitions\n" +
+                    "every <arg> checks (default partial-exists=0)",
+                    self.parse_partial_exists_option)
+
+        options.add(group, "model-pool",
+                    "Keep at most <arg> empty partition models to reuse them\n" +
+                    "instead of building new ones (default model-pool=0)",
+                    self.parse_model_pool_option)
+
+        options.add(group, "batch-partitions",
+                    "Solve the partitions of at most <arg> rows to check in one\n" +
+                    "block-diagonal LP (default batch-partitions=0)",
+                    self.parse_batch_partitions_option)
+
+        options.add(group, "check-policy",
+                    "Schedule the LP checks during propagation\n" +
+                    f"   <arg>: <policy>[,<n>] with <policy> in {{ {', '.join(AVAILABLE_POLICIES)} }}\n" +
+                    "      eager     : check on each propagation (default)\n" +
+                    "      every,<n> : check every <n> propagations\n" +
+                    "      level,<n> : check at decision levels <= <n>\n" +
+                    "      budget,<n>: check while LP checks take less than a fraction <n> of the time\n" +
+                    "      adaptive  : check less often when checks yield no conflict",
+                    self.parse_check_policy_option)
+
         options.add_flag(group, "show-lp-assignment",
                          "Show LP solution and the LP solver status for each partition of linear constraints",
                          self.show_lpassignments_flag)
@@ -58,6 +107,54 @@ class Application:
                          "Lazy SMT resolution (increase resolution speed)",
                          self.lazy_mode)
 
+        options.add_flag(group, "adaptive-watches",
+                         "Switch costly partitions with few conflicts to lazy checks",
+                         self.adaptive_watches)
+
+        options.add_flag(group, "share-conflicts",
+                         "Share the LP conflicts found by a thread with the other threads",
+                         self.share_conflicts)
+
+        options.add_flag(group, "lock-nogoods",
+                         "Lock the LP conflicts and skip the duplicated or subsumed ones",
+                         self.lock_nogoods)
+
+        options.add_flag(group, "minimize-nogoods",
+                         "Drop from the LP conflicts the condition literals whose terms cancel out (e.g. x-x) in every linear constraint of their atom, and from the forall conflicts the rows not connected to the violated constraint by their variables",
+                         self.minimize_nogoods)
+
+        options.add_flag(group, "partition-templates",
+                         "Clone new partition models from the rows shared with previous partitions",
+                         self.partition_templates)
+
+        options.add_flag(group, "decompose",
+                         "Check the independent components of the partitions separately",
+                         self.decompose)
+
+        options.add_flag(group, "nullspace-presolve",
+                         "Eliminate the equality rows fixed at init from the partitions (sparse nullspace substitution)",
+                         self.nullspace_presolve)
+
+        options.add_flag(group, "batch-forall",
+                         "Check the forall constraints of a partition in one batch: the domain is solved once, each objective is re-optimized from the previous basis and the batch stops at the first violated constraint",
+                         self.batch_forall)
+
+        options.add_flag(group, "dualize-forall",
+                         "Check the forall constraints as one feasibility LP with the rows of their duals in the partition",
+                         self.dualize_forall)
+
+        options.add_flag(group, "witness-store",
+                         "Keep the feasible points of the LP cache to check new configurations without solving",
+                         self.witness_store)
+
+        options.add_flag(group, "incremental-check",
+                         "Keep the LP rows of the unwatched literals between two total assignments and only update the changed ones",
+                         self.incremental_check)
+
+        options.add_flag(group, "symmetric-partitions",
+                         "Share the cache entries of the partitions equal up to the arguments of their identifiers in the variable names",
+                         self.symmetric_partitions)
+
         options.add_flag(group, "strict-forall",
                          "Force the linear domains of forall constraints to be satisfiable",
                          self.strict_forall)
@@ -68,6 +165,47 @@ class Application:
             return True
         return False
 
+    def parse_lp_propagation_option(self: Application, s: str) -> bool:
+        if s.isdigit():
+            self.lp_propagation = int(s)
+            return True
+        return False
+
+    def parse_partial_exists_option(self: Application, s: str) -> bool:
+        if s.isdigit():
+            self.partial_exists = int(s)
+            return True
+        return False
+
+    def parse_model_pool_option(self: Application, s: str) -> bool:
+        if s.isdigit():
+            self.model_pool = int(s)
+            return True
+        return False
+
+    def parse_batch_partitions_option(self: Application, s: str) -> bool:
+        if s.isdigit():
+            self.batch_partitions = int(s)
+            return True
+        return False
+
+    def parse_check_policy_option(self: Application, s: str) -> bool:
+        policy, _, parameter = s.partition(',')
+        if policy not in AVAILABLE_POLICIES:
+            return False
+        if policy in ('eager', 'adaptive'):
+            self.check_policy = policy  # type: ignore
+            return parameter == ''
+        try:
+            value: float = float(parameter)
+        except ValueError:
+            return False
+        if value < 0 or (policy == 'budget' and value > 1):
+            return False
+        self.check_policy = policy  # type: ignore
+        self.check_parameter = value
+        return True
+
     def validate_options(self: Application) -> bool:
         return True
 
@@ -79,6 +217,23 @@ class Application:
         # Initialize the contraint propagator
         self.propagator = LpPropagator(lpsolver=self.lpsolver)
         self.propagator.lazy(self.lazy_mode.flag)
+        self.propagator.adaptive_watches(self.adaptive_watches.flag)
+        self.propagator.share_conflicts(self.share_conflicts.flag)
+        self.propagator.lock_nogoods(self.lock_nogoods.flag)
+        self.propagator.minimize_nogoods(self.minimize_nogoods.flag)
+        self.propagator.partition_templates(self.partition_templates.flag)
+        self.propagator.model_pool(self.model_pool)
+        self.propagator.batch_partitions(self.batch_partitions)
+        self.propagator.decompose_partitions(self.decompose.flag)
+        self.propagator.nullspace_presolve(self.nullspace_presolve.flag)
+        self.propagator.batch_forall(self.batch_forall.flag)
+        self.propagator.dualize_forall(self.dualize_forall.flag)
+        self.propagator.witness_store(self.witness_store.flag)
+        self.propagator.incremental_check(self.incremental_check.flag)
+        self.propagator.symmetric_partitions(self.symmetric_partitions.flag)
+        self.propagator.lp_propagation(self.lp_propagation)
+        self.propagator.partial_exists_check(self.partial_exists)
+        self.propagator.check_policy(self.check_policy, self.check_parameter)
         self.propagator.show_lpassignment(self.show_lpassignments_flag.flag)
         self.propagator.strict_forall_check(not self.strict_forall.flag)
         control.register_propagator(self.propagator)  # type: ignore
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from math import nan
 from typing import Literal
+import re
 import sys
 
 from clingo import (
@@ -90,6 +91,9 @@ THEORY_LANGUAGE: str = """
 THEORY_OPERATORS: list[LpOperator] = [
     'dom', 'sum', 'maximize', 'minimize', 'assert']
 
+# ~ Tokens of a variable name: string literals or terms between delimiters
+VARIABLE_TOKENS: re.Pattern = re.compile(r'"(?:\\.|[^"\\])*"|[^(),]+')
+
 # ==============================================================================
 # Clingo AST rewriter
 # ==============================================================================
@@ -352,3 +356,39 @@ def parse_str(term: TheoryTerm) -> str:
     if term_type is TheoryTermType.Symbol:
         return term.name
     return str(term)
+
+# ==============================================================================
+# Symmetric partitions
+# ==============================================================================
+
+
+def parse_pid_arguments(term: TheoryTerm) -> dict[str, str]:
+    # --------------------------------------------------------------------------
+    # Each argument of the partition identifier is renamed after its position
+    # --------------------------------------------------------------------------
+    renaming: dict[str, str] = {}
+    if term.type not in (TheoryTermType.Function, TheoryTermType.Tuple):
+        return renaming
+    for i, argument in enumerate(term.arguments):
+        renaming.setdefault(str(argument), f'${i}')
+    return renaming
+
+
+def canonical_variable(variable: str, renaming: dict[str, str]) -> str:
+    # --------------------------------------------------------------------------
+    # Rename the arguments of the variable equal to an argument of the
+    # partition identifier ('$' never appears in a term outside strings)
+    # --------------------------------------------------------------------------
+    if len(renaming) == 0:
+        return variable
+
+    def rename(token: re.Match) -> str:
+        # ~ Only argument positions: function names are followed by '(' and
+        #   the variable name itself is not preceded by a delimiter
+        start, end = token.span()
+        is_argument: bool = start != 0 and variable[start - 1] in '(,' \
+            and variable[end:end + 1] != '('
+        if not is_argument:
+            return token.group(0)
+        return renaming.get(token.group(0), token.group(0))
+    return VARIABLE_TOKENS.sub(rename, variable)
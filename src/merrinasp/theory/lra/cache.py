@@ -14,6 +14,18 @@ from typing import Iterable
 CONSTRAINT = int
 CFG = set[CONSTRAINT]
 STATUS = tuple[CFG, float]
+VALUE = tuple[CFG, float]
+WITNESS = dict[str, float]
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+# ~ Feasible points kept for the SAT border entries
+WITNESSES_MAX: int = 32
+
+# ~ Minima kept per forall objective and border (oldest entries dropped)
+VALUES_MAX: int = 64
 
 # ==============================================================================
 # Lp Cache
@@ -31,43 +43,58 @@ class LpCache:
         self.__exist_unsat_border: list[CFG] = []
         self.__forall_sat_border: dict[int | None,list[CFG]] = {}
         self.__forall_unsat_border: dict[int | None,list[CFG]] = {}
-
-    def __add_exists_sat(self: LpCache, cfg: CFG) -> None:
+        # ~ Minima of the forall objectives (keyed by bound-free fingerprints):
+        #   lower bounds of the superset configurations (SAT border) and
+        #   upper bounds of the subset ones (UNSAT border)
+        self.__forall_values_sat: dict[int, list[VALUE]] = {}
+        self.__forall_values_unsat: dict[int, list[VALUE]] = {}
+        # ~ Feasible points of the exists SAT border entries (by configuration)
+        self.__witnesses: dict[frozenset[CONSTRAINT], WITNESS] = {}
+        # ~ Entries inserted from conflict cores (used for statistics), keyed
+        #   by configuration: the ids of removed entries may be reused
+        self.__cores: set[frozenset[CONSTRAINT]] = set()
+        self.core_hits: int = 0
+
+    def __add_exists_sat(self: LpCache, cfg: CFG) -> bool:
         subset_cfgs: list[CFG] = []
         for cfg_ in self.__exist_sat_border:
             if cfg_.issuperset(cfg):
-                return
+                return False
             if cfg_.issubset(cfg):
                 subset_cfgs.append(cfg_)
         self.__size -= len(subset_cfgs)
         for cfg_ in subset_cfgs:
             self.__exist_sat_border.remove(cfg_)
+            self.__witnesses.pop(frozenset(cfg_), None)
         self.__exist_sat_border.append(cfg)
         self.__size += 1
         self.__maxsize = max(self.__maxsize, self.__size)
+        return True
 
-    def __add_exists_unsat(self: LpCache, cfg: CFG) -> None:
+    def __add_exists_unsat(self: LpCache, cfg: CFG) -> bool:
         superset_cfgs: list[CFG] = []
         for cfg_ in self.__exist_unsat_border:
             if cfg_.issubset(cfg):
-                return
+                return False
             if cfg_.issuperset(cfg):
                 superset_cfgs.append(cfg_)
         self.__size -= len(superset_cfgs)
         for cfg_ in superset_cfgs:
             self.__exist_unsat_border.remove(cfg_)
+            self.__cores.discard(frozenset(cfg_))
         self.__exist_unsat_border.append(cfg)
         self.__size += 1
         self.__maxsize = max(self.__maxsize, self.__size)
+        return True
 
-    def __add_forall_sat(self: LpCache, cfg: CFG, objective: int) -> None:
+    def __add_forall_sat(self: LpCache, cfg: CFG, objective: int) -> bool:
         if objective not in self.__forall_sat_border:
             self.__forall_sat_border[objective] = [cfg]
-            return
+            return True
         superset_cfgs: list[CFG] = []
         for cfg_ in self.__forall_sat_border[objective]:
             if cfg_.issubset(cfg):
-                return
+                return False
             if cfg_.issuperset(cfg):
                 superset_cfgs.append(cfg_)
         self.__size -= len(superset_cfgs)
@@ -76,34 +103,92 @@ class LpCache:
         self.__forall_sat_border[objective].append(cfg)
         self.__size += 1
         self.__maxsize = max(self.__maxsize, self.__size)
+        return True
 
-    def __add_forall_unsat(self: LpCache, cfg: CFG, objective: int) -> None:
+    def __add_forall_unsat(self: LpCache, cfg: CFG, objective: int) -> bool:
         if objective not in self.__forall_unsat_border:
             self.__forall_unsat_border[objective] = [cfg]
-            return
+            return True
         subset_cfgs: list[CFG] = []
         for cfg_ in self.__forall_unsat_border[objective]:
             if cfg_.issuperset(cfg):
-                return
+                return False
             if cfg_.issubset(cfg):
                 subset_cfgs.append(cfg_)
         self.__size -= len(subset_cfgs)
         for cfg_ in subset_cfgs:
             self.__forall_unsat_border[objective].remove(cfg_)
+            self.__cores.discard(frozenset(cfg_))
         self.__forall_unsat_border[objective].append(cfg)
         self.__size += 1
         self.__maxsize = max(self.__maxsize, self.__size)
+        return True
 
     def add(self: LpCache, description: Iterable[CONSTRAINT],
-            objective: int | None, issat: bool) -> None:
+            objective: int | None, issat: bool, is_core: bool = False,
+            witness: WITNESS | None = None) -> None:
         cfg: CFG = set(description)
-        if objective is None:
-            if issat:
-                return self.__add_exists_sat(cfg)
-            return self.__add_exists_unsat(cfg)
-        if issat:
-            return self.__add_forall_sat(cfg, objective)
-        return self.__add_forall_unsat(cfg, objective)
+        is_added: bool
+        if objective is None and issat:
+            is_added = self.__add_exists_sat(cfg)
+        elif objective is None:
+            is_added = self.__add_exists_unsat(cfg)
+        elif issat:
+            is_added = self.__add_forall_sat(cfg, objective)
+        else:
+            is_added = self.__add_forall_unsat(cfg, objective)
+        if is_core and is_added:
+            self.__cores.add(frozenset(cfg))
+        if witness is not None and is_added and objective is None and issat:
+            self.__witnesses[frozenset(cfg)] = witness
+            if len(self.__witnesses) > WITNESSES_MAX:
+                del self.__witnesses[next(iter(self.__witnesses))]
+
+    def __add_value_sat(self: LpCache, cfg: CFG, objective: int,
+                        value: float) -> None:
+        values: list[VALUE] = \
+            self.__forall_values_sat.setdefault(objective, [])
+        for cfg_, value_ in values:
+            if cfg_.issubset(cfg) and value_ >= value:
+                return
+        values_: list[VALUE] = [
+            (cfg_, value_)
+            for cfg_, value_ in values
+            if not (cfg_.issuperset(cfg) and value_ <= value)
+        ]
+        values_.append((cfg, value))
+        if len(values_) > VALUES_MAX:
+            values_.pop(0)
+        self.__size += len(values_) - len(values)
+        self.__forall_values_sat[objective] = values_
+
+    def __add_value_unsat(self: LpCache, cfg: CFG, objective: int,
+                          value: float) -> None:
+        values: list[VALUE] = \
+            self.__forall_values_unsat.setdefault(objective, [])
+        for cfg_, value_ in values:
+            if cfg_.issuperset(cfg) and value_ <= value:
+                return
+        values_: list[VALUE] = [
+            (cfg_, value_)
+            for cfg_, value_ in values
+            if not (cfg_.issubset(cfg) and value_ >= value)
+        ]
+        values_.append((cfg, value))
+        if len(values_) > VALUES_MAX:
+            values_.pop(0)
+        self.__size += len(values_) - len(values)
+        self.__forall_values_unsat[objective] = values_
+
+    def add_value(self: LpCache, description: Iterable[CONSTRAINT],
+                  objective: int, value: float) -> None:
+        # ----------------------------------------------------------------------
+        # Only the entries answering tests no other entry answers are kept
+        # ----------------------------------------------------------------------
+        cfg: CFG = set(description)
+        self.__add_value_sat(cfg, objective, value)
+        self.__add_value_unsat(cfg, objective, value)
+        self.__maxsize = max(self.__maxsize, self.__size)
 
     def __check_exists(self: LpCache, cfg: CFG) -> None | bool:
         is_sat: bool = any(
@@ -112,12 +197,10 @@ class LpCache:
         )
         if is_sat:
             return True
-        is_unsat: bool = any(
-            cfg_.issubset(cfg)
-            for cfg_ in self.__exist_unsat_border
-        )
-        if is_unsat:
-            return False
+        for cfg_ in self.__exist_unsat_border:
+            if cfg_.issubset(cfg):
+                self.core_hits += frozenset(cfg_) in self.__cores
+                return False
         return None
 
     def __check_forall(self: LpCache, cfg: CFG, objective: int) -> None | bool:
@@ -127,12 +210,10 @@ class LpCache:
         )
         if is_sat:
             return True
-        is_unsat: bool = any(
-            cfg_.issuperset(cfg)
-            for cfg_ in self.__forall_unsat_border.get(objective, [])
-        )
-        if is_unsat:
-            return False
+        for cfg_ in self.__forall_unsat_border.get(objective, []):
+            if cfg_.issuperset(cfg):
+                self.core_hits += frozenset(cfg_) in self.__cores
+                return False
         return None
 
     def check(self: LpCache, description: Iterable[CONSTRAINT],
@@ -142,5 +223,23 @@ class LpCache:
             return self.__check_exists(cfg)
         return self.__check_forall(cfg, objective)
 
+    def check_value(self: LpCache, description: Iterable[CONSTRAINT],
+                    objective: int, bound: float) -> None | bool:
+        # ----------------------------------------------------------------------
+        # Minima only increase with the constraints: a subset configuration
+        # reaching the bound or a superset one missing it answers the test
+        # ----------------------------------------------------------------------
+        cfg: CFG = set(description)
+        for cfg_, value in self.__forall_values_sat.get(objective, []):
+            if value >= bound and cfg_.issubset(cfg):
+                return True
+        for cfg_, value in self.__forall_values_unsat.get(objective, []):
+            if value < bound and cfg_.issuperset(cfg):
+                return False
+        return None
+
+    def get_witnesses(self: LpCache) -> list[WITNESS]:
+        return list(reversed(self.__witnesses.values()))
+
     def get_size(self: LpCache) -> tuple[int, int]:
         return self.__size, self.__maxsize
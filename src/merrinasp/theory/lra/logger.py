@@ -17,17 +17,35 @@ class Logger:
         self.id: str = pid
         self.lpsolver_calls_nb: int = 0
         self.lpsolver_calls_sum: float = 0
+        self.partial_checks_nb: int = 0
+        self.batched_checks_nb: int = 0
+        self.batched_checks_sum: float = 0
+        self.batched_lps_nb: int = 0
+        self.reoptimizations_nb: int = 0
+        self.witness_refutations_nb: int = 0
+        self.pruned_rows_nb: int = 0
+        self.skipped_exists_nb: int = 0
+        self.skipped_forall_nb: int = 0
         self.cache_prevented_nb: int = 0
         self.cache_prevented_sum: float = 0
         self.cache_missed_nb: int = 0
         self.cache_missed_sum: float = 0
+        self.cache_values_nb: int = 0
+        self.witness_hits_nb: int = 0
         self.cache_size: list[int] = [0, 0]
+        self.cache_core_hits: int = 0
         self.conflicts_exists: int = 0
         self.conflicts_forall: int = 0
+        self.propagations: int = 0
+        self.watch_switches_nb: int = 0
         self.model_updates_nb: int = 0
         self.model_updates_sum: float = 0
         self.model_backtracks_nb: int = 0
         self.model_backtracks_sum: float = 0
+        self.static_rows_nb: int = 0
+        self.eliminated_rows_nb: int = 0
+        self.clones_nb: int = 0
+        self.reuses_nb: int = 0
 
     @classmethod
     def merge(cls: type[Logger],
@@ -42,6 +60,12 @@ class Logger:
                 logger.conflicts_exists for logger in loggers
             )
         }
+        statistics['Propagations'] = sum(
+            logger.propagations for logger in loggers
+        )
+        statistics['Watch switches'] = sum(
+            logger.watch_switches_nb for logger in loggers
+        )
         statistics['LP Solver'] = {
             'Modifications': {
                 'Updates (s)': sum(
@@ -49,6 +73,18 @@ class Logger:
                 ),
                 'Backtracks (s)': sum(
                     logger.model_backtracks_sum for logger in loggers
+                ),
+                'Static rows': sum(
+                    logger.static_rows_nb for logger in loggers
+                ),
+                'Eliminated rows': sum(
+                    logger.eliminated_rows_nb for logger in loggers
+                ),
+                'Clones': sum(
+                    logger.clones_nb for logger in loggers
+                ),
+                'Reuses': sum(
+                    logger.reuses_nb for logger in loggers
                 )
             },
             'Solving': {
@@ -57,7 +93,33 @@ class Logger:
                 ),
                 'Time (s)': sum(
                     logger.lpsolver_calls_sum for logger in loggers
-                )
+                ),
+                'Partial checks': sum(
+                    logger.partial_checks_nb for logger in loggers
+                ),
+                'Batched checks': sum(
+                    logger.batched_checks_nb for logger in loggers
+                ),
+                'Batched LPs': sum(
+                    logger.batched_lps_nb for logger in loggers
+                ),
+                'Re-optimizations': sum(
+                    logger.reoptimizations_nb for logger in loggers
+                ),
+                'Witness refutations': sum(
+                    logger.witness_refutations_nb for logger in loggers
+                ),
+                'Pruned core rows': sum(
+                    logger.pruned_rows_nb for logger in loggers
+                ),
+                'Skipped checks': {
+                    'Exists': sum(
+                        logger.skipped_exists_nb for logger in loggers
+                    ),
+                    'Forall': sum(
+                        logger.skipped_forall_nb for logger in loggers
+                    )
+                }
             },
             'Lp Cache': {
                 'Cache guesses': sum(
@@ -66,6 +128,15 @@ class Logger:
                 'Cache misses': sum(
                     logger.cache_missed_nb for logger in loggers
                 ),
+                'Value guesses': sum(
+                    logger.cache_values_nb for logger in loggers
+                ),
+                'Witness hits': sum(
+                    logger.witness_hits_nb for logger in loggers
+                ),
+                'Core hits': sum(
+                    logger.cache_core_hits for logger in loggers
+                ),
                 'Cost (s)': sum(
                     logger.cache_missed_sum + logger.cache_prevented_sum
                     for logger in loggers
@@ -6,12 +6,14 @@
 
 from __future__ import annotations
 from typing import Any, Literal
+from math import inf
 from time import time
 import sys
 
-from merrinasp.theory.language import LpConstraint
+from merrinasp.theory.language import LpConstraint, canonical_variable
 from merrinasp.theory.lra.logger import Logger
 from merrinasp.theory.lra.cache import LpCache
+from merrinasp.theory.lra.presolve import Substitution
 
 # ==============================================================================
 # Type Alias
@@ -24,6 +26,25 @@ LpStatus = Literal['optimal', 'unbounded', 'infeasible', 'undefined']
 ExistsConstraint = tuple[Any, Sense, float]
 ForallConstraint = tuple[Any, Sense, float]
 Objective = tuple[list[tuple[float, str]], Sense, float]
+Witness = dict[str, float]
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+# ~ Feasible points kept per partition to refute forall constraints
+WITNESSES_MAX: int = 8
+
+# ~ Violation under which a row is satisfied by the minimizer of a forall
+#   objective, and can not raise its optimum
+PRUNING_TOLERANCE: float = 10**-9
+
+# ~ Dualized forall constraints: slack of unused multipliers before a rebuild
+DUAL_VARIABLES_MIN: int = 32
+
+# ~ Dualized forall constraints: the rows of the duals are numbered after the
+#   solver literals
+DUAL_CIDS: int = 2**32
 
 # ==============================================================================
 # Lp Models
@@ -40,11 +61,19 @@ class ModelInterface:
         # ----------------------------------------------------------------------
         self.pid: str = pid
         self.lpsolver: str = lpsolver
+        # ~ Symmetric partitions: renaming of the arguments of the pid
+        self.renaming: dict[str, str] = {}
 
         # ----------------------------------------------------------------------
         # Parameters
         # ----------------------------------------------------------------------
         self.epsilon: float = epsilon
+        self.decompose: bool = False
+        # ~ Nullspace presolve of the static equality rows computed at init
+        self.presolved: tuple[Substitution, set[int]] = ({}, set())
+        self.batch_forall: bool = False
+        self.dualize: bool = False
+        self.witness_store: bool = False
 
         # ----------------------------------------------------------------------
         # Statistics
@@ -58,6 +87,7 @@ class ModelInterface:
         self.description: dict[int, int] = {}
         self.description_db: dict[int, int] = {}
         self.description_complement: list[int] = []
+        self.fingerprints: dict[int, int] = {}
 
         # ----------------------------------------------------------------------
         # Problem structure
@@ -65,6 +95,16 @@ class ModelInterface:
         self.constraints_exists: dict[int, ExistsConstraint]
         self.constraints_forall: dict[int, ForallConstraint]
         self.objectives: dict[int, Objective] = {}
+        self.rows: dict[int, tuple[list[tuple[float, str]], Sense, float]] = {}
+        self.rows_forall: dict[int, tuple[list[tuple[float, str]], float]] = {}
+        self.static: set[int] = set()
+
+        # ----------------------------------------------------------------------
+        # Nullspace presolve: static equality rows eliminated from the LP and
+        # substitution of their pivot variables (offset, free variables)
+        # ----------------------------------------------------------------------
+        self.eliminated: set[int] = set()
+        self.substitution: Substitution = {}
 
         # ----------------------------------------------------------------------
         # Model data
@@ -73,6 +113,25 @@ class ModelInterface:
         self.variables: dict[str, Any]
         self.constraints: dict[int, Any]
 
+        # ----------------------------------------------------------------------
+        # Dualized forall constraints: multipliers of the rows in the LP of the
+        # partition, their sign rows are kept between the checks
+        # ----------------------------------------------------------------------
+        self.dual_variables: set[str] = set()
+        self.dual_signs: dict[str, Any] = {}
+        self.dual_cids: int = 0
+
+        # ----------------------------------------------------------------------
+        # Witnesses: feasible points of the last solved LPs
+        # ----------------------------------------------------------------------
+        self.witnesses: list[Witness] = []
+        self.witnesses_feasible: list[Witness] | None = None
+
+        # ----------------------------------------------------------------------
+        # Independent components: rows of the last infeasible one
+        # ----------------------------------------------------------------------
+        self.unsat_component: set[int] | None = None
+
         # ----------------------------------------------------------------------
         # Debug
         # ----------------------------------------------------------------------
@@ -89,6 +148,8 @@ class ModelInterface:
         for cid, constraint, description in constraints:
             self.add(cid, constraint, description)
             self.added_order[-1].add(cid)
+        if len(self.eliminated) == 0 and len(self.presolved[1]) != 0:
+            self.__reduce()
 
     def add(self: ModelInterface, cid: int, constraint: LpConstraint,
             description: int) -> None:
@@ -106,10 +167,12 @@ class ModelInterface:
         if constraint_type == 'exists':
             assert cid not in self.constraints
             self.description[cid] = description
+            self.rows[cid] = (expr, sense, b)
+            expr_, shift = self.__substitute(expr)
             self.constraints_exists[cid] = (
-                self._get_lpexpression(expr),
+                self._get_lpexpression(expr_),
                 sense,
-                b
+                b - shift
             )
             self.constraints[cid] = self._add_lpconstraint(cid)
         elif constraint_type == 'forall':
@@ -117,10 +180,16 @@ class ModelInterface:
             if sense == '<=':
                 expr = [(-coeff, var) for coeff, var in expr]
             self.description_db[cid] = description
+            self.fingerprints[cid] = hash(tuple(sorted(
+                (coeff, canonical_variable(var, self.renaming))
+                for coeff, var in expr
+            )))
+            self.rows_forall[cid] = (expr, b if sense == '>=' else -b)
+            expr_, shift = self.__substitute(expr)
             self.constraints_forall[cid] = (
-                self._add_lpobjective(expr),
+                self._add_lpobjective(expr_),
                 '>=',
-                b if sense == '>=' else -b
+                self.rows_forall[cid][1] - shift
             )
         else:
             assert cid not in self.objectives
@@ -136,31 +205,193 @@ class ModelInterface:
         self.logger.model_updates_sum += time() - dt
 
     def remove(self: ModelInterface, cids: list[int]) -> None:
+        dt: float = time()
+        lpconstraints: list[Any] = []
+        is_reduced: bool = False
         for cid in cids:
-            dt: float = time()
-            if cid in self.constraints:
-                self._remove_lpconstraint(self.constraints[cid])
+            if cid in self.eliminated:
                 del self.description[cid]
                 del self.constraints_exists[cid]
+                del self.rows[cid]
+                self.static.discard(cid)
+                is_reduced = True
+            elif cid in self.constraints:
+                lpconstraints.append(self.constraints[cid])
+                del self.description[cid]
+                del self.constraints_exists[cid]
+                del self.rows[cid]
                 del self.constraints[cid]
             elif cid in self.constraints_forall:
                 del self.description_db[cid]
                 del self.constraints_forall[cid]
+                del self.rows_forall[cid]
+                del self.fingerprints[cid]
             elif cid in self.objectives:
                 del self.description_db[cid]
                 del self.objectives[cid]
             else:
                 assert False
-            empty_set: None | int = None
-            for i, batch in enumerate(self.added_order):
-                if cid in batch:
-                    batch.remove(cid)
-                    if len(batch) == 0:
-                        empty_set = i
-            if empty_set is not None:
-                del self.added_order[empty_set]
-            self.logger.model_backtracks_nb += 1
-            self.logger.model_backtracks_sum += time() - dt
+        # ----------------------------------------------------------------------
+        # Remove all the rows at once
+        # ----------------------------------------------------------------------
+        if len(lpconstraints) != 0:
+            self._remove_lpconstraints(lpconstraints)
+        if is_reduced:
+            self.__reduce()
+        # ----------------------------------------------------------------------
+        # Undo is LIFO: the removed constraints are in the last batches
+        # ----------------------------------------------------------------------
+        remaining: set[int] = set(cids) - self.static
+        for batch in reversed(self.added_order):
+            if len(remaining) == 0:
+                break
+            removed: set[int] = batch & remaining
+            batch -= removed
+            remaining -= removed
+        while len(self.added_order) != 0 and len(self.added_order[-1]) == 0:
+            self.added_order.pop()
+        if any(len(batch) == 0 for batch in self.added_order):
+            self.added_order = [batch for batch in self.added_order if batch]
+        self.logger.model_backtracks_nb += len(cids)
+        self.logger.model_backtracks_sum += time() - dt
+
+    def fix(self: ModelInterface, cids: list[int]) -> None:
+        # ----------------------------------------------------------------------
+        # Static constraints are never removed, even to compute the cores
+        # ----------------------------------------------------------------------
+        for cid in cids:
+            if cid not in self.constraints_exists or cid in self.static:
+                continue
+            self.static.add(cid)
+            self.logger.static_rows_nb += 1
+            for batch in self.added_order:
+                batch.discard(cid)
+        self.added_order = [batch for batch in self.added_order if batch]
+
+    # ==========================================================================
+    # Nullspace presolve
+    # ==========================================================================
+    def __reduce(self: ModelInterface) -> None:
+        # ----------------------------------------------------------------------
+        # Eliminate the static equality rows presolved at init: the
+        # substitution holds only while all of them are in the model, so that
+        # the descriptions cached stay those of the rows solved
+        # ----------------------------------------------------------------------
+        substitution, reducible = self.presolved
+        is_reduced: bool = reducible.issubset(self.rows)
+        if is_reduced == (len(self.eliminated) != 0):
+            return
+        self.substitution = substitution if is_reduced else {}
+        self.eliminated = set(reducible) if is_reduced else set()
+        self.logger.eliminated_rows_nb = len(self.eliminated)
+        # ----------------------------------------------------------------------
+        # Rebuild the rows and the forall objectives in the reduced coordinates
+        # ----------------------------------------------------------------------
+        for constraint in self.constraints.values():
+            self._remove_lpconstraint(constraint)
+        self.constraints.clear()
+        for cid, (expr, sense, b) in self.rows.items():
+            expr_, shift = self.__substitute(expr)
+            self.constraints_exists[cid] = (
+                self._get_lpexpression(expr_),
+                sense,
+                b - shift
+            )
+            if cid not in self.eliminated:
+                self.constraints[cid] = self._add_lpconstraint(cid)
+        for cid, (expr, b) in self.rows_forall.items():
+            expr_, shift = self.__substitute(expr)
+            self.constraints_forall[cid] = (
+                self._add_lpobjective(expr_),
+                '>=',
+                b - shift
+            )
+
+    def __substitute(self: ModelInterface, expr: list[tuple[float, str]]) \
+            -> tuple[list[tuple[float, str]], float]:
+        if len(self.substitution) == 0:
+            return expr, 0
+        shift: float = 0
+        coeffs: dict[str, float] = {}
+        for coeff, var in expr:
+            if var not in self.substitution:
+                coeffs[var] = coeffs.get(var, 0) + coeff
+                continue
+            offset, expr_ = self.substitution[var]
+            shift += coeff * offset
+            for coeff_, var_ in expr_:
+                coeffs[var_] = coeffs.get(var_, 0) + coeff * coeff_
+        return [(coeff, var) for var, coeff in coeffs.items() if coeff != 0], \
+            shift
+
+    def reset(self: ModelInterface, pid: str) -> None:
+        # ----------------------------------------------------------------------
+        # Empty the model to reuse it for another partition
+        # ----------------------------------------------------------------------
+        self.pid = pid
+        self.logger = Logger(pid)
+        self.description.clear()
+        self.description_db.clear()
+        self.description_complement.clear()
+        self.fingerprints.clear()
+        self.constraints_exists.clear()
+        self.constraints_forall.clear()
+        self.objectives.clear()
+        self.rows.clear()
+        self.rows_forall.clear()
+        self.static.clear()
+        self.eliminated.clear()
+        self.substitution.clear()
+        self.witnesses.clear()
+        self.variables.clear()
+        self.constraints.clear()
+        self.added_order.clear()
+        self.dual_variables.clear()
+        self.dual_signs.clear()
+        self._lpreset(pid)
+        self.default_objective = self._get_lpobjective()
+
+    def clone(self: ModelInterface, pid: str,
+              cids: dict[int, int]) -> ModelInterface:
+        # ----------------------------------------------------------------------
+        # Copy the LP problem and keep the rows of the mapped constraints
+        # ----------------------------------------------------------------------
+        model: ModelInterface = self.__class__(
+            self.lpsolver, pid, cache=self.cache, epsilon=self.epsilon
+        )
+        model.decompose = self.decompose
+        model.presolved = self.presolved
+        model.batch_forall = self.batch_forall
+        model.dualize = self.dualize
+        model.witness_store = self.witness_store
+        constraints: dict[int, Any] = model._lpcopy(self)
+        for cid, constraint in constraints.items():
+            if cid not in cids:
+                model._remove_lpconstraint(constraint)
+        # ----------------------------------------------------------------------
+        # Rename the kept rows after the constraints of the new partition: the
+        # rows first get unique temporary names since the new names may be a
+        # permutation of the template ones (duplicated names are ambiguous)
+        # ----------------------------------------------------------------------
+        for cid in cids:
+            constraints[cid] = model._rename_lpconstraint(
+                constraints[cid], f'tmp_{cid}'
+            )
+        model.added_order.append(set())
+        for cid, cid_ in cids.items():
+            expr, sense, b = self.rows[cid]
+            model.description[cid_] = self.description[cid]
+            model.rows[cid_] = self.rows[cid]
+            model.constraints_exists[cid_] = (
+                model._get_lpexpression(expr),
+                sense,
+                b
+            )
+            model.constraints[cid_] = model._rename_lpconstraint(
+                constraints[cid], f'cons_{cid_}'
+            )
+            model.added_order[-1].add(cid_)
+        return model
 
     # ==========================================================================
     # Cache
@@ -168,10 +399,12 @@ class ModelInterface:
     def __cache_check(self: ModelInterface, objective: int | None) \
             -> None | bool:
         dt: float = time()
+        core_hits: int = self.cache.core_hits
         cache_check: None | bool = self.cache.check(
             list(self.description.values()) + self.description_complement,
             objective if objective is not None else None
         )
+        self.logger.cache_core_hits += self.cache.core_hits - core_hits
         if cache_check is not None:
             self.logger.cache_prevented_nb += 1
             self.logger.cache_prevented_sum += time() - dt
@@ -181,16 +414,21 @@ class ModelInterface:
         return None
 
     def __cache_add(self: ModelInterface, objective: int | None,
-                    issat: bool) -> None:
+                    issat: bool, is_core: bool = False,
+                    witness: Witness | None = None) -> None:
         self.cache.add(
             list(self.description.values()) + self.description_complement,
             objective if objective is not None else None,
-            issat
+            issat,
+            is_core,
+            witness
         )
 
-    def __lpsolve(self: ModelInterface) -> tuple[LpStatus, float | None]:
+    def __lpsolve(self: ModelInterface, warm: bool = False) \
+            -> tuple[LpStatus, float | None]:
         # ----------------------------------------------------------------------
-        # SOLVER: solve the problem
+        # SOLVER: solve the problem (warm: only the objective changed since
+        # the last solve)
         # ----------------------------------------------------------------------
         # Statuses:
         # 'optimal': 'An optimal solution as been found.'
@@ -198,7 +436,11 @@ class ModelInterface:
         # 'unbounded': 'The objective can be optimized infinitely.'
         # 'undefined': 'The solver determined that the problem is ill-formed.'
         dt = time()
-        status, optimum = self._lpsolve()
+        if warm:
+            status, optimum = self._lpreoptimize()
+            self.logger.reoptimizations_nb += 1
+        else:
+            status, optimum = self._lpsolve()
         self.logger.lpsolver_calls_nb += 1
         self.logger.lpsolver_calls_sum += time() - dt
         return status, optimum
@@ -207,24 +449,144 @@ class ModelInterface:
     # Solving
     # ==========================================================================
     def check_exists(self: ModelInterface) -> bool:
+        self.unsat_component = None
+        if self.decompose and len(self.description_complement) == 0:
+            return self.__check_exists_components()
         # ----------------------------------------------------------------------
         # Check if it is already solved
         # ----------------------------------------------------------------------
+        known: None | bool = self.check_exists_cache()
+        if known is not None:
+            return known
+        return self.solve_exists()
+
+    def check_exists_cache(self: ModelInterface) -> None | bool:
+        self.unsat_component = None
         cache_check: None | bool = self.__cache_check(None)
         if cache_check is not None:
             return cache_check
         # ----------------------------------------------------------------------
+        # Check if a feasible point of the cache satisfies the rows
+        # ----------------------------------------------------------------------
+        if self.witness_store and len(self.description_complement) == 0:
+            for witness in self.cache.get_witnesses():
+                if self.__is_feasible(witness):
+                    self.logger.witness_hits_nb += 1
+                    self.__cache_add(None, True, witness=witness)
+                    return True
+        return None
+
+    def set_exists(self: ModelInterface, issat: bool,
+                   witness: Witness | None = None) -> None:
+        # ----------------------------------------------------------------------
+        # Result found outside of the model (e.g. in a stacked LP)
+        # ----------------------------------------------------------------------
+        if witness is not None:
+            self.__add_witness(witness)
+        self.__cache_add(
+            None, issat, witness=witness if self.witness_store else None
+        )
+
+    def solve_exists(self: ModelInterface) -> bool:
+        witness: Witness | None = None
+        # ----------------------------------------------------------------------
         # Solve
         # ----------------------------------------------------------------------
         status, _ = self.__lpsolve()
         issat: bool = status in ('optimal', 'unbounded')
+        if status == 'optimal':
+            self.__add_witness()
+            if self.witness_store:
+                witness = self.__point()
         # ----------------------------------------------------------------------
         # Update Cache
         # ----------------------------------------------------------------------
-        self.__cache_add(None, issat)
+        self.__cache_add(None, issat, witness=witness)
         return issat
 
-    def __solve_objective(self:ModelInterface, objective: Any) \
+    def __check_exists_components(self: ModelInterface) -> bool:
+        # ----------------------------------------------------------------------
+        # A single component is checked as the whole partition
+        # ----------------------------------------------------------------------
+        components: list[set[int]] = self.__components()
+        if len(components) <= 1:
+            known: None | bool = self.check_exists_cache()
+            if known is not None:
+                return known
+            return self.solve_exists()
+        # ----------------------------------------------------------------------
+        # Check each independent component in the cache, then solve the
+        # unknown ones alone until one fails
+        # ----------------------------------------------------------------------
+        for component in components:
+            descriptions: list[int] = [
+                self.description[cid] for cid in component
+            ]
+            dt: float = time()
+            core_hits: int = self.cache.core_hits
+            issat: None | bool = self.cache.check(descriptions, None)
+            self.logger.cache_core_hits += self.cache.core_hits - core_hits
+            if issat is not None:
+                self.logger.cache_prevented_nb += 1
+                self.logger.cache_prevented_sum += time() - dt
+            else:
+                self.logger.cache_missed_nb += 1
+                self.logger.cache_missed_sum += time() - dt
+                issat = self.__solve_component(component)
+                self.cache.add(descriptions, None, issat)
+            if not issat:
+                self.unsat_component = component
+                return False
+        return True
+
+    def __solve_component(self: ModelInterface, component: set[int]) -> bool:
+        # ----------------------------------------------------------------------
+        # Solve the rows of the component: the other rows leave the LP
+        # ----------------------------------------------------------------------
+        others: list[int] = [
+            cid for cid in self.constraints if cid not in component
+        ]
+        self._remove_lpconstraints([self.constraints[cid] for cid in others])
+        status, _ = self.__lpsolve()
+        for cid in others:
+            self.constraints[cid] = self._add_lpconstraint(cid)
+        return status in ('optimal', 'unbounded')
+
+    def __components(self: ModelInterface) -> list[set[int]]:
+        # ----------------------------------------------------------------------
+        # Union-find over the variables of the active rows
+        # ----------------------------------------------------------------------
+        parents: dict[str, str] = {}
+
+        def find(var: str) -> str:
+            root: str = var
+            while parents[root] != root:
+                root = parents[root]
+            while parents[var] != root:
+                parents[var], var = root, parents[var]
+            return root
+
+        components: dict[str, set[int]] = {}
+        constant_rows: list[set[int]] = []
+        for cid in self.description:
+            expr, _, _ = self.rows[cid]
+            if len(expr) == 0:
+                constant_rows.append({cid})
+                continue
+            root: str = parents.setdefault(expr[0][1], expr[0][1])
+            root = find(root)
+            for _, var in expr[1:]:
+                root_: str = find(parents.setdefault(var, var))
+                if root_ != root:
+                    parents[root_] = root
+        for cid in self.description:
+            expr, _, _ = self.rows[cid]
+            if len(expr) != 0:
+                components.setdefault(find(expr[0][1]), set()).add(cid)
+        return list(components.values()) + constant_rows
+
+    def __solve_objective(self:ModelInterface, objective: Any,
+                          restore: bool = True, warm: bool = False) \
             -> tuple[LpStatus, float | None]:
         # ----------------------------------------------------------------------
         # Add new objective
@@ -233,15 +595,18 @@ class ModelInterface:
         # ----------------------------------------------------------------------
         # Compute optimum
         # ----------------------------------------------------------------------
-        status, optimum = self.__lpsolve()
+        status, optimum = self.__lpsolve(warm)
+        if status == 'optimal':
+            self.__add_witness()
         # ----------------------------------------------------------------------
         # Remove current objective
         # ----------------------------------------------------------------------
-        self._set_lpobjective(self.default_objective)
+        if restore:
+            self._set_lpobjective(self.default_objective)
         return status, optimum
 
-    def __valid_forall(self:ModelInterface, cid: int) \
-            -> bool:
+    def __valid_forall(self:ModelInterface, cid: int, restore: bool = True,
+                       warm: bool = False) -> bool:
         # ----------------------------------------------------------------------
         # Check if it is already solved
         # ----------------------------------------------------------------------
@@ -250,39 +615,243 @@ class ModelInterface:
         )
         if cache_check is not None:
             return cache_check
+        objective, sense, b = self.constraints_forall[cid]
+        assert sense == '>='
+        # ----------------------------------------------------------------------
+        # Check if the minimum of the objective is known for another bound
+        # ----------------------------------------------------------------------
+        _, shift = self.__substitute(self.rows_forall[cid][0])
+        value_check: None | bool = self.cache.check_value(
+            self.description.values(),
+            self.fingerprints[cid],
+            b + shift - self.epsilon
+        )
+        if value_check is not None:
+            self.logger.cache_values_nb += 1
+            self.__cache_add(self.description_db[cid], value_check)
+            return value_check
+        # ----------------------------------------------------------------------
+        # Check if a known feasible point violates the forall constraint
+        # ----------------------------------------------------------------------
+        if self.__refute_forall(cid):
+            self.logger.witness_refutations_nb += 1
+            self.__cache_add(self.description_db[cid], False)
+            return False
+        # ----------------------------------------------------------------------
+        # Dualized forall: a feasibility problem instead of an optimization
+        # ----------------------------------------------------------------------
+        if self.dualize:
+            issat: bool = self.__valid_forall_dual(cid)
+            self.__cache_add(self.description_db[cid], issat)
+            return issat
         # ----------------------------------------------------------------------
         # Solve
         # ----------------------------------------------------------------------
-        objective, sense, b = self.constraints_forall[cid]
-        assert sense == '>='
-        status, optimum = self.__solve_objective(objective)
+        status, optimum = self.__solve_objective(objective, restore, warm)
         # ----------------------------------------------------------------------
         # Split the different cases and update Cache
         # ----------------------------------------------------------------------
-        issat: bool
+        minimum: float
         if status == 'optimal':
             assert optimum is not None
             issat = optimum >= b - self.epsilon
+            minimum = optimum + shift
             self.__cache_add(None, True)
         elif status == 'infeasible':
             issat = True
+            minimum = inf
             self.__cache_add(None, False)
         elif status == 'unbounded':
             issat = False
+            minimum = -inf
             self.__cache_add(None, True)
         else:
             print('Error: Unknown LP solver status:', status)
             sys.exit(0)
         self.__cache_add(self.description_db[cid], issat)
+        self.cache.add_value(
+            self.description.values(), self.fingerprints[cid], minimum
+        )
         return issat
 
+    def __valid_forall_dual(self: ModelInterface, cid: int) -> bool:
+        # ----------------------------------------------------------------------
+        # Weak duality: min c.x >= b over A.x ~ r if there are multipliers y
+        # (>= 0 for >= rows, <= 0 for <= rows) with A^T.y = c and r.y >= b.
+        # Strong duality: otherwise the forall constraint is violated if the
+        # partition is feasible
+        # ----------------------------------------------------------------------
+        known: None | bool = self.__cache_check(None)
+        if known is not None and not known:
+            return True
+        # ----------------------------------------------------------------------
+        # One feasibility LP: the rows of the partition and of the dual
+        # ----------------------------------------------------------------------
+        dual_rows: list[Any] = self.__add_dual(cid)
+        status, _ = self.__lpsolve()
+        self._remove_lpconstraints(dual_rows)
+        if status in ('optimal', 'unbounded'):
+            self.__cache_add(None, True)
+            return True
+        if known is None:
+            known = self.check_exists()
+        return not known
+
+    def __add_dual(self: ModelInterface, cid: int) -> list[Any]:
+        # ----------------------------------------------------------------------
+        # The sign rows of the multipliers are kept between the checks: the
+        # ones of the removed rows are dropped when they pile up
+        # ----------------------------------------------------------------------
+        if len(self.dual_signs) > 2 * len(self.constraints) \
+                + DUAL_VARIABLES_MIN:
+            multipliers: set[str] = {
+                f'dual_{cid_}' for cid_ in self.constraints
+            }
+            unused: list[str] = [
+                multiplier for multiplier in self.dual_signs
+                if multiplier not in multipliers
+            ]
+            self._remove_lpconstraints([
+                self.dual_signs.pop(multiplier) for multiplier in unused
+            ])
+        # ----------------------------------------------------------------------
+        # One multiplier per row of the LP and one row per variable (rebuilt
+        # for each objective), in the coordinates of the presolve
+        # ----------------------------------------------------------------------
+        expr, _ = self.__substitute(self.rows_forall[cid][0])
+        _, _, b = self.constraints_forall[cid]
+        costs: dict[str, float] = {}
+        for coeff, var in expr:
+            costs[var] = costs.get(var, 0) + coeff
+        columns: dict[str, list[tuple[float, str]]] = {var: [] for var in costs}
+        dual_objective: list[tuple[float, str]] = []
+        for cid_ in self.constraints:
+            expr_, shift = self.__substitute(self.rows[cid_][0])
+            _, sense, r = self.rows[cid_]
+            multiplier: str = f'dual_{cid_}'
+            for coeff, var in expr_:
+                columns.setdefault(var, []).append((coeff, multiplier))
+            dual_objective.append((r - shift, multiplier))
+            if multiplier not in self.dual_variables:
+                self.dual_variables.add(multiplier)
+                self.variables[multiplier] = self._add_lpvariable(multiplier)
+            if sense != '=' and multiplier not in self.dual_signs:
+                self.dual_signs[multiplier] = self.__add_dual_row(
+                    [(1, multiplier)], sense, 0
+                )
+        dual_rows: list[Any] = [
+            self.__add_dual_row(column, '=', costs.get(var, 0))
+            for var, column in columns.items()
+        ]
+        dual_rows.append(self.__add_dual_row(
+            dual_objective, '>=', b - self.epsilon
+        ))
+        return dual_rows
+
+    def __add_dual_row(self: ModelInterface,
+                       expr: list[tuple[float, str]], sense: Sense,
+                       r: float) -> Any:
+        self.dual_cids += 1
+        cid: int = DUAL_CIDS + self.dual_cids
+        self.constraints_exists[cid] = (self._get_lpexpression(expr), sense, r)
+        constraint: Any = self._add_lpconstraint(cid)
+        del self.constraints_exists[cid]
+        return constraint
+
+    def __add_witness(self: ModelInterface,
+                      witness: Witness | None = None) -> None:
+        # ----------------------------------------------------------------------
+        # Only the solutions of the complete model are kept (not the ones
+        # found while computing the cores)
+        # ----------------------------------------------------------------------
+        if len(self.constraints_forall) == 0 \
+                or len(self.description) != len(self.rows):
+            return
+        if witness is None:
+            witness = self.__point()
+        if witness is None:
+            return
+        self.witnesses.append(witness)
+        if len(self.witnesses) > WITNESSES_MAX:
+            self.witnesses.pop(0)
+        if self.witnesses_feasible is not None:
+            self.witnesses_feasible.append(witness)
+
+    def __is_feasible(self: ModelInterface, witness: Witness) -> bool:
+        for cid in self.description:
+            expr, sense, b = self.rows[cid]
+            violation: float | None = self.__violation(expr, sense, b, witness)
+            if violation is None or violation > self.epsilon:
+                return False
+        return True
+
+    def __violation(self: ModelInterface, expr: list[tuple[float, str]],
+                    sense: Sense, b: float, witness: Witness) -> float | None:
+        activity: float = 0
+        for coeff, var in expr:
+            if var not in witness:
+                return None
+            activity += coeff * witness[var]
+        if sense == '<=':
+            return max(activity - b, 0)
+        if sense == '>=':
+            return max(b - activity, 0)
+        return abs(activity - b)
+
+    def __refute_forall(self: ModelInterface, cid: int) -> bool:
+        # ----------------------------------------------------------------------
+        # The witnesses are filtered once per forall check
+        # ----------------------------------------------------------------------
+        if self.witnesses_feasible is None:
+            self.witnesses = [
+                witness
+                for witness in self.witnesses
+                if self.__is_feasible(witness)
+            ]
+            self.witnesses_feasible = self.witnesses.copy()
+        expr, b = self.rows_forall[cid]
+        for witness in self.witnesses_feasible:
+            value: float = 0
+            for coeff, var in expr:
+                value += coeff * witness.get(var, 0)
+            if value < b - self.epsilon:
+                return True
+        return False
+
     def check_forall(self: ModelInterface) -> list[int]:
+        self.witnesses_feasible = None
+        if self.batch_forall:
+            return self.__check_forall_batch()
         conflicts: list[int] = []
         for cid in self.constraints_forall:
             if not self.__valid_forall(cid):
                 conflicts.append(cid)
         return conflicts
 
+    def __check_forall_batch(self: ModelInterface) -> list[int]:
+        # ----------------------------------------------------------------------
+        # An infeasible domain satisfies every forall constraint
+        # ----------------------------------------------------------------------
+        calls: int = self.logger.lpsolver_calls_nb
+        if len(self.constraints_forall) > 1 and not self.check_exists():
+            for cid in self.constraints_forall:
+                self.__cache_add(self.description_db[cid], True)
+            return []
+        # ----------------------------------------------------------------------
+        # The rows do not change in the batch: once the domain has been
+        # solved, each objective is re-optimized from the previous basis. The
+        # batch stops at the first violated constraint and restores the
+        # default objective once
+        # ----------------------------------------------------------------------
+        conflicts: list[int] = []
+        for cid in self.constraints_forall:
+            warm: bool = self.logger.lpsolver_calls_nb != calls
+            if not self.__valid_forall(cid, restore=False, warm=warm):
+                conflicts.append(cid)
+                break
+        self._set_lpobjective(self.default_objective)
+        return conflicts
+
     def optimize(self: ModelInterface) \
             -> tuple[str, None | dict[str, float | None]]:
         status: LpStatus = 'undefined'
@@ -319,7 +888,8 @@ class ModelInterface:
             # ------------------------------------------------------------------
             # Set the objective function
             # ------------------------------------------------------------------
-            self._set_lpobjective(self._add_lpobjective(expr))
+            expr_, shift = self.__substitute(expr)
+            self._set_lpobjective(self._add_lpobjective(expr_))
             # ------------------------------------------------------------------
             # Solve the LP problem
             # ------------------------------------------------------------------
@@ -331,6 +901,7 @@ class ModelInterface:
             if status != 'optimal':
                 break
             assert optimum is not None
+            optimum += shift
             # ------------------------------------------------------------------
             # Fix the objective
             # ------------------------------------------------------------------
@@ -364,6 +935,114 @@ class ModelInterface:
                 merged_expr[var] = merged_expr.get(var, 0) + coeff
         return [(coeff, var) for var, coeff in merged_expr.items()]
 
+    # ==========================================================================
+    # Theory propagation
+    # ==========================================================================
+    def propagate_implied(self: ModelInterface,
+                          candidates: list[list[tuple[int,
+                                                      LpConstraint,
+                                                      int]]],
+                          budget: int) -> list[list[int]]:
+        # ----------------------------------------------------------------------
+        # Only the atoms whose rows would make the partition infeasible are
+        # implied (false). An atom whose rows are entailed by the active rows
+        # is not implied true: a false atom does not add any row, so both of
+        # its values may belong to answer sets
+        # ----------------------------------------------------------------------
+        implied: list[list[int]] = []
+        bounds: dict[str, tuple[float, int, float, int]] = \
+            self.__variable_bounds()
+        lpcalls: int = self.logger.lpsolver_calls_nb
+        issat: bool | None = None
+        for constraints in candidates:
+            # ------------------------------------------------------------------
+            # Activity bounds: conflicts that do not need any LP call
+            # ------------------------------------------------------------------
+            reason: list[int] | None = None
+            for cid, (_, expr, sense, b), _ in constraints:
+                reason = self.__activity_conflict(expr, sense, b, bounds)
+                if reason is not None:
+                    reason.append(abs(cid))
+                    break
+            if reason is not None:
+                implied.append(reason)
+                self.logger.propagations += 1
+                continue
+            # ------------------------------------------------------------------
+            # Bound LP: the constraint would make the partition infeasible
+            # ------------------------------------------------------------------
+            if self.logger.lpsolver_calls_nb - lpcalls >= budget:
+                continue
+            if issat is None:
+                issat = self.check_exists()
+            if not issat:
+                continue
+            self.update(constraints)
+            if not self.check_exists():
+                implied.append(self.__core_unsat_exists())
+                self.logger.propagations += 1
+            self.remove([cid for cid, _, _ in constraints])
+        return implied
+
+    def __variable_bounds(self: ModelInterface) \
+            -> dict[str, tuple[float, int, float, int]]:
+        bounds: dict[str, tuple[float, int, float, int]] = {}
+        for cid, (expr, sense, b) in self.rows.items():
+            if len(expr) != 1 or expr[0][0] == 0:
+                continue
+            coeff, var = expr[0]
+            value: float = b / coeff
+            lb, lb_cid, ub, ub_cid = bounds.get(var, (-inf, 0, inf, 0))
+            if sense == '=' or (sense == '>=') == (coeff > 0):
+                if value > lb:
+                    lb, lb_cid = value, cid
+            if sense == '=' or (sense == '<=') == (coeff > 0):
+                if value < ub:
+                    ub, ub_cid = value, cid
+            bounds[var] = (lb, lb_cid, ub, ub_cid)
+        return bounds
+
+    def __activity_conflict(self: ModelInterface,
+                            expr: list[tuple[float, str]], sense: Sense,
+                            b: float,
+                            bounds: dict[str, tuple[float, int, float, int]]) \
+            -> list[int] | None:
+        # ----------------------------------------------------------------------
+        # Merge the coefficients of each variable
+        # ----------------------------------------------------------------------
+        coeffs: dict[str, float] = {}
+        for coeff, var in expr:
+            coeffs[var] = coeffs.get(var, 0) + coeff
+        # ----------------------------------------------------------------------
+        # Compute the minimal and maximal activities of the expression
+        # ----------------------------------------------------------------------
+        min_activity: float = 0
+        max_activity: float = 0
+        min_reason: list[int] = []
+        max_reason: list[int] = []
+        for var, coeff in coeffs.items():
+            if coeff == 0:
+                continue
+            lb, lb_cid, ub, ub_cid = bounds.get(var, (-inf, 0, inf, 0))
+            if coeff > 0:
+                min_activity += coeff * lb
+                max_activity += coeff * ub
+                min_reason.append(lb_cid)
+                max_reason.append(ub_cid)
+            else:
+                min_activity += coeff * ub
+                max_activity += coeff * lb
+                min_reason.append(ub_cid)
+                max_reason.append(lb_cid)
+        # ----------------------------------------------------------------------
+        # Check if the constraint can not be satisfied
+        # ----------------------------------------------------------------------
+        if sense in ('<=', '=') and min_activity > b + self.epsilon:
+            return [abs(cid) for cid in set(min_reason)]
+        if sense in ('>=', '=') and max_activity < b - self.epsilon:
+            return [abs(cid) for cid in set(max_reason)]
+        return None
+
     # ==========================================================================
     # Core conflicts
     # ==========================================================================
@@ -372,16 +1051,33 @@ class ModelInterface:
         # If Lazy: do not compute the unsatisfiable core
         # ----------------------------------------------------------------------
         if lazy:
-            return list(self.constraints.keys())
+            return [cid for cid in self.constraints if cid not in self.static]
         # ----------------------------------------------------------------------
         # Else: compute the unsatisfiable core
         # ----------------------------------------------------------------------
+        self.logger.conflicts_exists += 1
+        return self.__core_unsat_exists()
+
+    def __core_unsat_exists(self: ModelInterface) -> list[int]:
         conflicting_cids: list[int] = []
         removed_constraints: list[int] = []
         removed_description: dict[int, int] = {}
+        # ----------------------------------------------------------------------
+        # The core is inside the infeasible component: remove the others
+        # ----------------------------------------------------------------------
+        component: set[int] | None = self.unsat_component
+        if component is not None:
+            for cid in list(self.constraints):
+                if cid in component or cid in self.static:
+                    continue
+                self._remove_lpconstraint(self.constraints[cid])
+                removed_description[cid] = self.description[cid]
+                removed_constraints.append(cid)
+                del self.constraints[cid]
+                del self.description[cid]
         for batch in self.added_order:
             for cid in batch:
-                if cid not in self.constraints_exists:
+                if cid not in self.constraints:
                     continue
                 # --------------------------------------------------------------
                 # Remove a constraint
@@ -397,7 +1093,8 @@ class ModelInterface:
             if issat:
                 self.__cache_add(None, True)
                 for cid in batch:
-                    if cid not in self.constraints_exists:
+                    if cid not in removed_description \
+                            or cid in removed_constraints:
                         continue
                     conflicting_cids.append(abs(cid))
                     self.constraints[cid] = self._add_lpconstraint(cid)
@@ -405,18 +1102,20 @@ class ModelInterface:
                     del removed_description[cid]
             else:
                 for cid in batch:
-                    if cid not in self.constraints_exists:
+                    if cid not in removed_description \
+                            or cid in removed_constraints:
                         continue
                     removed_constraints.append(cid)
         # ----------------------------------------------------------------------
+        # The remaining rows are the core: an infeasible configuration
+        # ----------------------------------------------------------------------
+        self.__cache_add(None, False, is_core=True)
+        # ----------------------------------------------------------------------
         # Re-add all the removed constraints
         # ----------------------------------------------------------------------
-        # self.__cache_add(None, False)
         for cid in removed_constraints:
             self.constraints[cid] = self._add_lpconstraint(cid)
         self.description = self.description | removed_description
-
-        self.logger.conflicts_exists += 1
         return conflicting_cids
 
     def core_unsat_forall(self: ModelInterface, conflict: int,
@@ -436,6 +1135,13 @@ class ModelInterface:
         self._set_lpobjective(objective)
         # self.description[conflict] = self.description_db[conflict]
         # ----------------------------------------------------------------------
+        # Minimizer of the objective: the rows it satisfies can not raise the
+        # optimum
+        # ----------------------------------------------------------------------
+        minimizer: Witness | None = None
+        if sum(len(group) for group in unprop_cids.values()) > 1:
+            minimizer = self.__minimizer()
+        # ----------------------------------------------------------------------
         # For each unused constraints group
         # ----------------------------------------------------------------------
         optimum_cores: list[int] = []
@@ -444,17 +1150,35 @@ class ModelInterface:
             assert up_cid not in self.constraints
             is_meaningfull: bool = False
             # ------------------------------------------------------------------
+            # Try the constraints the most violated by the minimizer first
+            # ------------------------------------------------------------------
+            if minimizer is not None:
+                up_constraints = sorted(
+                    up_constraints,
+                    key=lambda c: -self.__ranking(c[0], minimizer)
+                )
+            # ------------------------------------------------------------------
             # For each unused constraints in the group
             # ------------------------------------------------------------------
             for up_constraint, up_description in up_constraints:
+                _, up_expr, up_sense, up_b = up_constraint
+                violation: float | None = None
+                if minimizer is not None:
+                    violation = self.__violation(
+                        up_expr, up_sense, up_b, minimizer
+                    )
                 # --------------------------------------------------------------
                 # Add the constraint
                 # --------------------------------------------------------------
                 self.add(up_cid, up_constraint, up_description)
-                cache_check: None | bool = self.__cache_check(
-                    self.description_db[conflict]
-                )
-                if cache_check is None:
+                is_pruned: bool = violation is not None \
+                    and violation <= PRUNING_TOLERANCE
+                cache_check: None | bool = None if is_pruned \
+                    else self.__cache_check(self.description_db[conflict])
+                if is_pruned:
+                    is_meaningfull = False
+                    self.logger.pruned_rows_nb += 1
+                elif cache_check is None:
                     # ----------------------------------------------------------
                     # Compute optimum
                     # ----------------------------------------------------------
@@ -476,8 +1200,13 @@ class ModelInterface:
                         self.description_db[conflict],
                         is_meaningfull
                     )
+                    if not is_meaningfull:
+                        minimizer = self.__point() if status == 'optimal' \
+                            else None
                 else:
                     is_meaningfull = cache_check
+                    if not is_meaningfull:
+                        minimizer = None
                 # --------------------------------------------------------------
                 # Stop if the constraint is meaningfull
                 # --------------------------------------------------------------
@@ -489,19 +1218,25 @@ class ModelInterface:
                 del self.description[up_cid]
                 del self.constraints[up_cid]
                 del self.constraints_exists[up_cid]
+                del self.rows[up_cid]
             # ------------------------------------------------------------------
             # if the constraint is meaningfull it is added to the optimum core
             # ------------------------------------------------------------------
             if is_meaningfull:
                 optimum_cores.append(up_cid)
 
+        # ----------------------------------------------------------------------
+        # The objective is still violated with the constraints that are not
+        # in the optimum core
+        # ----------------------------------------------------------------------
+        self.__cache_add(
+            self.description_db[conflict],
+            False,
+            is_core=True
+        )
         # ----------------------------------------------------------------------
         # Remove all added constraints
         # ----------------------------------------------------------------------
-        # self.__cache_add(
-        #     self.description_db[conflict],
-        #     False
-        # )
         for lpconstraint in to_remove_constraints:
             self._remove_lpconstraint(lpconstraint)
             self.description_complement.clear()
@@ -512,6 +1247,24 @@ class ModelInterface:
         # del self.description[conflict]
         return optimum_cores
 
+    def __minimizer(self: ModelInterface) -> Witness | None:
+        status, _ = self.__lpsolve()
+        if status != 'optimal':
+            return None
+        return self.__point()
+
+    def __point(self: ModelInterface) -> Witness | None:
+        assignment: dict[str, float | None] = self.get_assignment()
+        if None in assignment.values():
+            return None
+        return assignment  # type: ignore
+
+    def __ranking(self: ModelInterface, constraint: LpConstraint,
+                  minimizer: Witness) -> float:
+        _, expr, sense, b = constraint
+        violation: float | None = self.__violation(expr, sense, b, minimizer)
+        return inf if violation is None else violation
+
     # ==========================================================================
     # Getters
     # ==========================================================================
@@ -519,10 +1272,31 @@ class ModelInterface:
         return self.logger
 
     def get_assignment(self: ModelInterface) -> dict[str, float | None]:
-        return {var: self._get_lpvalue(var) for var in self.variables}
+        lpvalues: dict[str, float | None] = {
+            var: self._get_lpvalue(var)
+            for var in self.variables
+            if var not in self.substitution and var not in self.dual_variables
+        }
+        # ----------------------------------------------------------------------
+        # Map the eliminated variables back from the nullspace variables
+        # ----------------------------------------------------------------------
+        assignment: dict[str, float | None] = {}
+        for var in self.variables:
+            if var in self.dual_variables:
+                continue
+            if var not in self.substitution:
+                assignment[var] = lpvalues[var]
+                continue
+            offset, expr = self.substitution[var]
+            values: list[float | None] = [lpvalues.get(var_) for _, var_ in expr]
+            assignment[var] = None if None in values else offset + sum(
+                coeff * value  # type: ignore
+                for (coeff, _), value in zip(expr, values)
+            )
+        return assignment
 
     def is_empty(self: ModelInterface) -> bool:
-        no_constraint: bool = len(self.constraints) == 0
+        no_constraint: bool = len(self.constraints_exists) == 0
         no_forall: bool = len(self.constraints_forall) == 0
         no_obj: bool = len(self.objectives) == 0
         return no_constraint and no_forall and no_obj
@@ -557,8 +1331,28 @@ class ModelInterface:
     def _remove_lpconstraint(self: ModelInterface, constraint: Any) -> None:
         raise NotImplementedError()
 
+    def _remove_lpconstraints(self: ModelInterface,
+                              constraints: list[Any]) -> None:
+        for constraint in constraints:
+            self._remove_lpconstraint(constraint)
+
+    def _rename_lpconstraint(self: ModelInterface, constraint: Any,
+                             consname: str) -> Any:
+        raise NotImplementedError()
+
+    def _lpcopy(self: ModelInterface, template: Any) -> dict[int, Any]:
+        raise NotImplementedError()
+
+    def _lpreset(self: ModelInterface, pid: str) -> None:
+        raise NotImplementedError()
+
     def _lpsolve(self: ModelInterface) -> tuple[LpStatus, float | None]:
         raise NotImplementedError()
 
+    def _lpreoptimize(self: ModelInterface) \
+            -> tuple[LpStatus, float | None]:
+        # ~ Solve again after an objective change (warm-started if supported)
+        return self._lpsolve()
+
     def _get_lpvalue(self: ModelInterface, varname: str) -> float | None:
         raise NotImplementedError()
@@ -21,11 +21,15 @@ from swiglpk import (  # type: ignore
     glp_set_obj_dir,
     glp_init_smcp,
     GLP_MIN,
+    GLP_PRIMAL,
     glp_smcp,
     GLP_OFF,
     glp_term_out,
     glp_create_index,
     glp_create_prob,
+    glp_copy_prob,
+    glp_erase_prob,
+    GLP_ON,
     glp_get_num_rows,
     glp_get_num_cols,
     glp_get_col_name,
@@ -114,6 +118,9 @@ class ModelGLPK(ModelInterface):
         glp_set_obj_dir(model, GLP_MIN)
         self.__smcp = glp_smcp()
         glp_init_smcp(self.__smcp)
+        self.__smcp_primal = glp_smcp()
+        glp_init_smcp(self.__smcp_primal)
+        self.__smcp_primal.meth = GLP_PRIMAL
         glp_term_out(GLP_OFF)
         return model
 
@@ -159,13 +166,17 @@ class ModelGLPK(ModelInterface):
         consname: str = f'cons_{cid}'
         glp_set_row_name(self.model, index, consname)
 
+        # ~ GLPK forbids duplicated columns in a row: merge the coefficients
+        coeffs: dict[int, float] = {}
+        for coeff, varname in expression:
+            assert varname in self.variables
+            varindex: int = self.variables[varname]
+            coeffs[varindex] = coeffs.get(varindex, 0) + coeff
         num_cols: int = glp_get_num_cols(self.model)
-        num_vars: int = len(expression)
+        num_vars: int = len(coeffs)
         index_array: intArray = intArray(num_cols + 1)
         value_array: doubleArray = doubleArray(num_cols + 1)
-        for i, (coeff, varname) in enumerate(expression):
-            assert varname in self.variables
-            varindex: int = self.variables[varname]
+        for i, (varindex, coeff) in enumerate(coeffs.items()):
             index_array[i + 1] = varindex
             value_array[i + 1] = coeff
         glp_set_mat_row(self.model, index, num_vars, index_array, value_array)
@@ -199,6 +210,43 @@ class ModelGLPK(ModelInterface):
         glp_del_rows(self.model, 1, num)
         self.__clear_unused_lpvariable()
 
+    def _remove_lpconstraints(self: ModelGLPK, constraints: list[str]) -> None:
+        indexes: list[int] = [
+            index
+            for index in (
+                glp_find_row(self.model, constraint)
+                for constraint in constraints
+            )
+            if index != 0
+        ]
+        if len(indexes) == 0:
+            return
+        num = intArray(len(indexes) + 1)
+        for i, index in enumerate(indexes):
+            num[i + 1] = index
+        glp_del_rows(self.model, len(indexes), num)
+        self.__clear_unused_lpvariable()
+
+    def _rename_lpconstraint(self: ModelGLPK, constraint: str,
+                             consname: str) -> str:
+        if consname != constraint:
+            index: int = glp_find_row(self.model, constraint)
+            glp_set_row_name(self.model, index, consname)
+        return consname
+
+    def _lpcopy(self: ModelGLPK, template: ModelGLPK) -> dict[int, str]:
+        glp_copy_prob(self.model, template.model, GLP_ON)
+        glp_create_index(self.model)
+        glp_set_prob_name(self.model, f'PID_{self.pid}')
+        self.variables = template.variables.copy()
+        return template.constraints.copy()
+
+    def _lpreset(self: ModelGLPK, pid: str) -> None:
+        glp_erase_prob(self.model)
+        glp_create_index(self.model)
+        glp_set_prob_name(self.model, f'PID_{pid}')
+        glp_set_obj_dir(self.model, GLP_MIN)
+
     def _lpsolve(self: ModelGLPK) -> tuple[LpStatus, float | None]:
         glp_scale_prob(self.model, GLP_SF_AUTO)
         status: LpStatus = self.__lpsolve_glpk()
@@ -209,6 +257,20 @@ class ModelGLPK(ModelInterface):
             return status, glp_get_obj_val(self.model)
         return status, None
 
+    def _lpreoptimize(self: ModelGLPK) -> tuple[LpStatus, float | None]:
+        # ----------------------------------------------------------------------
+        # Only the objective changed: the basis of the previous solve stays
+        # primal feasible (no scaling nor advanced basis in between)
+        # ----------------------------------------------------------------------
+        if glp_simplex(self.model, self.__smcp_primal) != 0:
+            return self._lpsolve()
+        status: LpStatus = self.__get_status()
+        if status == 'undefined':
+            return self._lpsolve()
+        if status == 'optimal':
+            return status, glp_get_obj_val(self.model)
+        return status, None
+
     def _get_lpvalue(self: ModelGLPK, varname: str) -> float | None:
         assert varname in self.variables
         varindex: int = self.variables[varname]
@@ -229,6 +291,9 @@ class ModelGLPK(ModelInterface):
 
     def __lpsolve_glpk(self: ModelGLPK) -> LpStatus:
         glp_simplex(self.model, self.__smcp)
+        return self.__get_status()
+
+    def __get_status(self: ModelGLPK) -> LpStatus:
         glpk_status: int = glp_get_status(self.model)
         status: LpStatus = 'undefined'
         if glpk_status in [GLP_OPT, GLP_FEAS]:
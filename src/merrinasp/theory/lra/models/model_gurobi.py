@@ -5,6 +5,7 @@
 # ==============================================================================
 
 from __future__ import annotations
+from threading import local
 
 from gurobipy import Model, LinExpr, Constr, Var, GRB, Env
 
@@ -23,6 +24,24 @@ ExistsConstraint = tuple[LinExpr, Sense, float]
 ForallConstraint = tuple[LinExpr, Sense, float]
 Objective = tuple[LinExpr, Sense, float]
 
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+# ~ Gurobi environments are costly to start: one is shared by thread
+ENVIRONMENTS: local = local()
+
+
+def get_environment() -> Env:
+    if not hasattr(ENVIRONMENTS, 'env'):
+        # ~ Remove all automated logs message when calling Gurobi solver
+        env: Env = Env(empty=True)
+        env.setParam("OutputFlag", 0)
+        env.setParam("LogToConsole", 0)
+        env.start()
+        ENVIRONMENTS.env = env
+    return ENVIRONMENTS.env
+
 # ==============================================================================
 # Lp Models
 # ==============================================================================
@@ -53,13 +72,7 @@ class ModelGurobiPy(ModelInterface):
     # ==========================================================================
 
     def _lpinit(self: ModelGurobiPy, pid: str) -> Model:
-        # ~ Remove all automated logs message when calling Gurobi solver
-        ENV: Env = Env(empty=True)
-        ENV.setParam("OutputFlag", 0)
-        ENV.setParam("LogToConsole", 0)
-        ENV.start()
-        # ~ Init model
-        model: Model = Model(f'PID_{pid}', env = ENV)
+        model: Model = Model(f'PID_{pid}', env=get_environment())
         model.setParam(GRB.Param.OutputFlag, 0)
         model.setParam(GRB.Param.LogToConsole, 0)
         model.setParam(GRB.Param.DualReductions, 0)
@@ -111,6 +124,35 @@ class ModelGurobiPy(ModelInterface):
     def _remove_lpconstraint(self: ModelGurobiPy, constraint: Constr) -> None:
         self.model.remove(constraint)
 
+    def _remove_lpconstraints(self: ModelGurobiPy,
+                              constraints: list[Constr]) -> None:
+        self.model.remove(constraints)
+
+    def _rename_lpconstraint(self: ModelGurobiPy, constraint: Constr,
+                             consname: str) -> Constr:
+        constraint.ConstrName = consname
+        return constraint
+
+    def _lpcopy(self: ModelGurobiPy,
+                template: ModelGurobiPy) -> dict[int, Constr]:
+        template.model.update()
+        self.model = template.model.copy()
+        self.model.ModelName = f'PID_{self.pid}'
+        self.variables = {
+            varname: self.model.getVarByName(lpvar.VarName)
+            for varname, lpvar in template.variables.items()
+        }
+        return {
+            cid: self.model.getConstrByName(constraint.ConstrName)
+            for cid, constraint in template.constraints.items()
+        }
+
+    def _lpreset(self: ModelGurobiPy, pid: str) -> None:
+        self.model.remove(self.model.getConstrs())
+        self.model.remove(self.model.getVars())
+        self.model.ModelName = f'PID_{pid}'
+        self.model.update()
+
     def _lpsolve(self: ModelGurobiPy) -> tuple[LpStatus, float | None]:
         self.model.optimize()
         status_id: int = self.model.Status
@@ -120,6 +120,31 @@ class ModelOptlang(ModelInterface):
                              constraint: interface.Constraint) -> None:
         self.model.remove(constraint)
 
+    def _remove_lpconstraints(self: ModelOptlang,
+                              constraints: list[interface.Constraint]) -> None:
+        self.model.remove(constraints)
+
+    def _rename_lpconstraint(self: ModelOptlang,
+                             constraint: interface.Constraint,
+                             consname: str) -> interface.Constraint:
+        constraint.name = consname
+        return constraint
+
+    def _lpcopy(self: ModelOptlang,
+                template: ModelOptlang) -> dict[int, interface.Constraint]:
+        self.model = self.interface.Model.clone(template.model)
+        self.variables = {
+            varname: self.model.variables[lpvar.name]
+            for varname, lpvar in template.variables.items()
+        }
+        return {
+            cid: self.model.constraints[constraint.name]
+            for cid, constraint in template.constraints.items()
+        }
+
+    def _lpreset(self: ModelOptlang, pid: str) -> None:
+        self.model = self._lpinit(pid)
+
     def _lpsolve(self: ModelOptlang) -> tuple[LpStatus, float | None]:
         status: LpStatus = self.model.optimize()
         if status == 'optimal':
@@ -5,6 +5,8 @@
 # ==============================================================================
 
 from __future__ import annotations
+from copy import deepcopy
+from typing import Any
 import sys
 
 from pulp import (  # type: ignore
@@ -134,6 +136,32 @@ class ModelPuLP(ModelInterface):
         del self.model.constraints[constraint.name]
         self.__clear_unused_lpvariable()
 
+    def _rename_lpconstraint(self: ModelPuLP, constraint: LpConstraint,
+                             consname: str) -> LpConstraint:
+        if consname != constraint.name:
+            del self.model.constraints[constraint.name]
+            constraint.name = consname
+            self.model.constraints[consname] = constraint
+        return constraint
+
+    def _lpcopy(self: ModelPuLP,
+                template: ModelPuLP) -> dict[int, LpConstraint]:
+        memo: dict[int, Any] = {}
+        self.model = deepcopy(template.model, memo)
+        self.variables = {}
+        for varname, lpvar in template.variables.items():
+            if id(lpvar) in memo:
+                self.variables[varname] = memo[id(lpvar)]
+            else:
+                self.variables[varname] = self._add_lpvariable(varname)
+        return {
+            cid: memo[id(constraint)]
+            for cid, constraint in template.constraints.items()
+        }
+
+    def _lpreset(self: ModelPuLP, pid: str) -> None:
+        self.model = self._lpinit(pid)
+
     def _lpsolve(self: ModelPuLP) -> tuple[LpStatus, float | None]:
         status: LpStatus = \
             PulpStatus[self.model.solve(
@@ -0,0 +1,63 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+from typing import Iterable
+
+# ==============================================================================
+# Type Alias
+# ==============================================================================
+
+Nogood = tuple[int, ...]
+
+# ==============================================================================
+# Nogood Store
+# ==============================================================================
+
+
+class NogoodStore:
+
+    def __init__(self: NogoodStore) -> None:
+        # ----------------------------------------------------------------------
+        # Database
+        # ----------------------------------------------------------------------
+        # ~ Nogoods indexed by their smallest literal: a stored nogood is a
+        #   subset of a new one only if its smallest literal is in the new one
+        self.__nogoods: set[Nogood] = set()
+        self.__index: dict[int, list[frozenset[int]]] = {}
+
+        # ----------------------------------------------------------------------
+        # Statistics
+        # ----------------------------------------------------------------------
+        self.added_nb: int = 0
+        self.duplicates_nb: int = 0
+        self.subsumed_nb: int = 0
+
+    def add(self: NogoodStore, nogood: Iterable[int]) -> bool:
+        key: Nogood = tuple(sorted(set(nogood)))
+        # ----------------------------------------------------------------------
+        # Already added nogood
+        # ----------------------------------------------------------------------
+        if key in self.__nogoods:
+            self.duplicates_nb += 1
+            return False
+        # ----------------------------------------------------------------------
+        # Nogood subsumed by an already added one
+        # ----------------------------------------------------------------------
+        literals: frozenset[int] = frozenset(key)
+        for literal in key:
+            for nogood_ in self.__index.get(literal, []):
+                if nogood_.issubset(literals):
+                    self.subsumed_nb += 1
+                    return False
+        # ----------------------------------------------------------------------
+        # New nogood
+        # ----------------------------------------------------------------------
+        self.__nogoods.add(key)
+        if len(key) != 0:
+            self.__index.setdefault(key[0], []).append(literals)
+        self.added_nb += 1
+        return True
@@ -0,0 +1,126 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+# ==============================================================================
+# Type Alias
+# ==============================================================================
+
+Expression = list[tuple[float, str]]
+Row = tuple[Expression, str, float]
+Substitution = dict[str, tuple[float, Expression]]
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+PRESOLVE_TOLERANCE: float = 10**-9
+
+# ~ Threshold pivoting: a pivot is at least this fraction of the largest
+#   coefficient of its row
+PIVOT_THRESHOLD: float = 0.1
+
+# ~ Pivots filling more entries are left in the LP: the substituted rows stay
+#   sparse
+MARKOWITZ_MAX: int = 16
+
+# ==============================================================================
+# Nullspace presolve
+# ==============================================================================
+
+
+def nullspace_substitution(rows: list[Row]) \
+        -> tuple[Substitution, set[int]] | None:
+    # --------------------------------------------------------------------------
+    # Build the sparse equality system A.x = b (rows and columns indexes)
+    # --------------------------------------------------------------------------
+    matrix: list[dict[str, float]] = []
+    rhs: list[float] = []
+    columns: dict[str, set[int]] = {}
+    for expr, sense, bound in rows:
+        assert sense == '='
+        row: dict[str, float] = {}
+        for coeff, var in expr:
+            row[var] = row.get(var, 0) + coeff
+        row = {
+            var: coeff
+            for var, coeff in row.items()
+            if abs(coeff) > PRESOLVE_TOLERANCE
+        }
+        for var in row:
+            columns.setdefault(var, set()).add(len(matrix))
+        matrix.append(row)
+        rhs.append(bound)
+    # --------------------------------------------------------------------------
+    # Sparse Gauss-Jordan elimination: the pivots minimize the Markowitz count
+    # (fill-in) among the numerically stable coefficients of the sparsest row
+    # --------------------------------------------------------------------------
+    scale: float = 1 + max((abs(bound) for bound in rhs), default=0)
+    active: set[int] = set(range(len(matrix)))
+    pivots: dict[str, int] = {}
+    eliminated: set[int] = set()
+    while len(active) != 0:
+        i: int = min(active, key=lambda i: len(matrix[i]))
+        active.discard(i)
+        row = matrix[i]
+        if len(row) == 0:
+            # ~ Inconsistent systems are left to the LP solver
+            if abs(rhs[i]) > PRESOLVE_TOLERANCE * scale:
+                return None
+            # ~ Combination of the pivot rows: redundant
+            eliminated.add(i)
+            continue
+        largest: float = max(abs(coeff) for coeff in row.values())
+        pivot: str = min(
+            (
+                var
+                for var, coeff in row.items()
+                if abs(coeff) >= PIVOT_THRESHOLD * largest
+            ),
+            key=lambda var: (len(row) - 1) * (len(columns[var]) - 1)
+        )
+        # ~ The original row is kept in the LP: the pivot rows only combine
+        #   pivot rows, so they stay equivalent to the eliminated ones
+        if (len(row) - 1) * (len(columns[pivot]) - 1) > MARKOWITZ_MAX:
+            continue
+        # ----------------------------------------------------------------------
+        # Normalize the pivot row and eliminate the pivot from the other rows
+        # ----------------------------------------------------------------------
+        coeff_pivot: float = row[pivot]
+        for var in row:
+            row[var] /= coeff_pivot
+        rhs[i] /= coeff_pivot
+        for j in list(columns[pivot]):
+            if j == i:
+                continue
+            row_: dict[str, float] = matrix[j]
+            factor: float = row_[pivot]
+            for var, coeff in row.items():
+                value: float = row_.get(var, 0) - factor * coeff
+                if abs(value) > PRESOLVE_TOLERANCE:
+                    if var not in row_:
+                        columns[var].add(j)
+                    row_[var] = value
+                elif var in row_:
+                    del row_[var]
+                    columns[var].discard(j)
+            rhs[j] -= factor * rhs[i]
+        pivots[pivot] = i
+        eliminated.add(i)
+    if len(pivots) == 0:
+        return None
+    # --------------------------------------------------------------------------
+    # x_p = b_p - sum(a_pv.x_v) where the free variables x_v span the nullspace
+    # --------------------------------------------------------------------------
+    substitution: Substitution = {
+        pivot: (
+            rhs[i],
+            [(-coeff, var) for var, coeff in matrix[i].items() if var != pivot]
+        )
+        for pivot, i in pivots.items()
+    }
+    return substitution, eliminated
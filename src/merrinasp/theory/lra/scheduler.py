@@ -0,0 +1,125 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+from typing import Literal
+from time import time
+
+from merrinasp.theory.lra.logger import Logger
+
+# ==============================================================================
+# Type Alias
+# ==============================================================================
+
+Policy = Literal['eager', 'every', 'level', 'budget', 'adaptive']
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+AVAILABLE_POLICIES: list[str] = [
+    'eager',
+    'every',
+    'level',
+    'budget',
+    'adaptive'
+]
+
+ADAPTIVE_MAX_INTERVAL: int = 64
+
+# ~ Per-partition adaptive watches
+WATCHES_INTERVAL: int = 128
+WATCHES_MIN_CALLS: int = 16
+WATCHES_MIN_COST: float = 10**-3
+WATCHES_MAX_YIELD: float = 10**-2
+
+# ==============================================================================
+# Scheduler
+# ==============================================================================
+
+
+class LpScheduler:
+
+    def __init__(self: LpScheduler, policy: Policy = 'eager',
+                 parameter: float = 0) -> None:
+        # ----------------------------------------------------------------------
+        # Parameters
+        # ----------------------------------------------------------------------
+        # ~ eager: check on each propagation
+        # ~ every: check every <parameter> propagations
+        # ~ level: check at decision levels lower or equal to <parameter>
+        # ~ budget: check while the checking time is lower than a fraction
+        #   <parameter> of the solving time
+        # ~ adaptive: check less often when the checks do not yield conflicts
+        self.policy: Policy = policy
+        self.parameter: float = parameter
+
+        # ----------------------------------------------------------------------
+        # State
+        # ----------------------------------------------------------------------
+        self.start: float = time()
+        self.propagations: int = 0
+        self.interval: int = 1
+        self.check_time: float = 0
+
+        # ----------------------------------------------------------------------
+        # Statistics
+        # ----------------------------------------------------------------------
+        self.checks_nb: int = 0
+        self.skipped_nb: int = 0
+
+    def should_check(self: LpScheduler, decision_level: int) -> bool:
+        self.propagations += 1
+        check: bool = True
+        if self.policy == 'every':
+            check = self.propagations >= self.parameter
+        elif self.policy == 'level':
+            check = decision_level <= self.parameter
+        elif self.policy == 'budget':
+            elapsed: float = time() - self.start
+            check = self.check_time <= self.parameter * elapsed
+        elif self.policy == 'adaptive':
+            check = self.propagations >= self.interval
+        if check:
+            self.propagations = 0
+            self.checks_nb += 1
+        else:
+            self.skipped_nb += 1
+        return check
+
+    def notify(self: LpScheduler, conflict: bool, dt: float) -> None:
+        self.check_time += dt
+        if self.policy != 'adaptive':
+            return
+        # ----------------------------------------------------------------------
+        # Adaptive: double the interval after each check without conflicts
+        # ----------------------------------------------------------------------
+        if conflict:
+            self.interval = 1
+        else:
+            self.interval = min(2 * self.interval, ADAPTIVE_MAX_INTERVAL)
+
+
+# ==============================================================================
+# Per-partition watch policy
+# ==============================================================================
+
+
+def is_lazy_partition(logger: Logger | None) -> bool:
+    # --------------------------------------------------------------------------
+    # A partition is lazy if its LPs are costly and rarely yield conflicts
+    # --------------------------------------------------------------------------
+    if logger is None:
+        return False
+    # ~ Checks answered by a stacked LP cost their share of it
+    calls: int = logger.lpsolver_calls_nb + logger.batched_checks_nb
+    if calls < WATCHES_MIN_CALLS:
+        return False
+    cost: float = \
+        (logger.lpsolver_calls_sum + logger.batched_checks_sum) / calls
+    checks: int = calls + logger.cache_prevented_nb
+    conflicts: int = logger.conflicts_exists + logger.conflicts_forall
+    return cost >= WATCHES_MIN_COST and conflicts < WATCHES_MAX_YIELD * checks
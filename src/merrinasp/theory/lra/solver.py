@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import Generator
 from time import time
 
-from clingo import PropagateInit
+from clingo import PropagateInit, TheoryAtom
 
 from merrinasp.theory.lra.logger import Logger
 from merrinasp.theory.lra.models import (
@@ -20,9 +20,16 @@ from merrinasp.theory.lra.models import (
 from merrinasp.theory.language import (
     LpConstraint,
     ParsedLpConstraint,
-    parse_atom
+    canonical_variable,
+    parse_atom,
+    parse_pid_arguments
 )
 from merrinasp.theory.lra.cache import LpCache
+from merrinasp.theory.lra.presolve import (
+    Row,
+    Substitution,
+    nullspace_substitution
+)
 
 
 # ==============================================================================
@@ -33,6 +40,14 @@ PID = str
 SID = int
 DESCRIPTION = int
 
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+# ~ Partition templates
+TEMPLATES_MAX: int = 8
+TEMPLATE_MIN_ROWS: int = 32
+
 # ==============================================================================
 # Solver
 # ==============================================================================
@@ -40,7 +55,13 @@ DESCRIPTION = int
 class LpSolver:
 
     def __init__(self: LpSolver, init: PropagateInit,
-                 lpsolver: str = 'glpk', strict_forall: bool = True) -> None:
+                 lpsolver: str = 'glpk', strict_forall: bool = True,
+                 partial_exists: int = 0, templates: bool = False,
+                 model_pool: int = 0, decompose: bool = False,
+                 presolve: bool = False, batch_forall: bool = False,
+                 dualize: bool = False, witness_store: bool = False,
+                 symmetric: bool = False, batch_partitions: int = 0,
+                 minimize: bool = False) -> None:
         self.preprocessing_time: float = time()
         # ----------------------------------------------------------------------
         # Select LpSolver
@@ -48,12 +69,78 @@ class LpSolver:
         self.__init_lpsolver(lpsolver, strict_forall)
         self.__cache: LpCache = LpCache()
 
+        # ----------------------------------------------------------------------
+        # Partial checks of exists constraints
+        # ----------------------------------------------------------------------
+        self.partial_exists: int = partial_exists
+        self.partial_exists_rounds: int = 0
+
         # ----------------------------------------------------------------------
         # Database - Lp Models
         # ----------------------------------------------------------------------
         self.models: dict[str, ModelInterface] = {}
         self.models_forall: dict[str, list[int]] = {}
 
+        # ----------------------------------------------------------------------
+        # Database - Partition templates (model, description -> cids, pid)
+        # ----------------------------------------------------------------------
+        self.templates_enabled: bool = templates
+        self.templates: list[tuple[ModelInterface,
+                                   dict[int, list[int]],
+                                   str]] = []
+
+        # ----------------------------------------------------------------------
+        # Database - Pool of empty models to reuse
+        # ----------------------------------------------------------------------
+        self.pool_size: int = model_pool
+        self.pool: list[ModelInterface] = []
+
+        # ----------------------------------------------------------------------
+        # Check the independent components of the partitions separately
+        # ----------------------------------------------------------------------
+        self.decompose: bool = decompose
+
+        # ----------------------------------------------------------------------
+        # Eliminate the static equality rows with their nullspace
+        # ----------------------------------------------------------------------
+        self.presolve: bool = presolve
+        self.pids_presolved: dict[str, tuple[Substitution, set[int]]] = {}
+
+        # ----------------------------------------------------------------------
+        # Evaluate the forall constraints of a partition in one batch
+        # ----------------------------------------------------------------------
+        self.batch_forall: bool = batch_forall
+
+        # ----------------------------------------------------------------------
+        # Check the forall constraints through their dual feasibility
+        # ----------------------------------------------------------------------
+        self.dualize: bool = dualize
+
+        # ----------------------------------------------------------------------
+        # Keep the feasible points of the cache to answer new configurations
+        # ----------------------------------------------------------------------
+        self.witness_store: bool = witness_store
+
+        # ----------------------------------------------------------------------
+        # Solve the small partitions to check in one block-diagonal LP
+        # ----------------------------------------------------------------------
+        self.batch_rows: int = batch_partitions
+        self.batch_model: ModelInterface | None = None
+        self.batch_cache: LpCache = LpCache()
+        self.batch_logger: Logger = Logger('batch')
+        self.batch_calls: int = 0
+
+        # ----------------------------------------------------------------------
+        # Database - Symmetric partitions: variables renamed modulo the
+        # arguments of the partition identifiers in the descriptions
+        # ----------------------------------------------------------------------
+        # ~ Renamed descriptions may stand for different rows: they are never
+        #   mapped on the rows of a template
+        self.symmetric: bool = symmetric
+        self.pids_renaming: dict[str, dict[str, str]] = {}
+        self.canonical_variables: dict[tuple[str, str], str] = {}
+        self.descriptions_renamed: set[int] = set()
+
         # ----------------------------------------------------------------------
         # Database - LP constraints
         # ----------------------------------------------------------------------
@@ -63,9 +150,28 @@ class LpSolver:
         self.cids_constraints: dict[int, ParsedLpConstraint] = {}
         self.cids_grounded_constraints: \
             dict[int, list[tuple[LpConstraint, int]]] = {}
+        self.cids_void: dict[int, set[int]] = {}
+
+        # ----------------------------------------------------------------------
+        # Database - Independent components of the partitions: roots of the
+        # variables of each constraint under any of its conditions
+        # ----------------------------------------------------------------------
+        # ~ Only used to minimize the forall conflicts
+        self.minimize: bool = minimize
+        self.cids_components: dict[int, set[tuple[str, str]]] = {}
 
         self.pids_checked_exists: dict[str, bool] = {}
         self.pids_checked_forall: dict[str, bool] = {}
+        self.pids_sat_exists: dict[str, bool] = {}
+        self.pids_valid_forall: dict[str, bool] = {}
+        self.pids_implied: set[str] = set()
+
+        # ----------------------------------------------------------------------
+        # Database - Completion counters and queues of partitions to check
+        # ----------------------------------------------------------------------
+        self.pids_unguessed: dict[str, int] = {}
+        self.pids_queue_exists: dict[str, None] = {}
+        self.pids_queue_forall: dict[str, None] = {}
 
         # ----------------------------------------------------------------------
         # Initialize internal memory
@@ -104,10 +210,15 @@ class LpSolver:
             print('Set to default value "glpk".')
 
     def __init_memory(self: LpSolver, init: PropagateInit) -> None:
+        static_equalities: dict[str, list[tuple[int, Row]]] = {}
         for atom in init.theory_atoms:
             pid: str = str(atom.term.arguments[0])
             cid: int = atom.literal
             self.pids.setdefault(pid, []).append(cid)
+            if self.symmetric and pid not in self.pids_renaming:
+                self.pids_renaming[pid] = \
+                    parse_pid_arguments(atom.term.arguments[0])
+            self.pids_unguessed[pid] = self.pids_unguessed.get(pid, 0) + 1
             self.cids_guessed[cid] = False
             self.cids_propagated[cid] = False
             constraints: list[ParsedLpConstraint] = parse_atom(atom)
@@ -119,6 +230,105 @@ class LpSolver:
                 self.cids_constraints[-cid] = constraints[1]
                 if constraints[1][0] == 'forall':
                     self.models_forall.setdefault(pid, []).append(-cid)
+            self.cids_void[cid] = self.__void_conditions(constraints)
+            if self.presolve:
+                self.__add_static_equality(init, atom, static_equalities)
+        if self.minimize:
+            self.__init_components()
+        # ----------------------------------------------------------------------
+        # Nullspace presolve of the equality rows fixed at init, once per
+        # partition
+        # ----------------------------------------------------------------------
+        for pid, rows in static_equalities.items():
+            presolved: tuple[Substitution, set[int]] | None = \
+                nullspace_substitution([row for _, row in rows])
+            if presolved is None:
+                continue
+            substitution, eliminated = presolved
+            self.pids_presolved[pid] = (
+                substitution,
+                {rows[i][0] for i in eliminated}
+            )
+
+    def __init_components(self: LpSolver) -> None:
+        # ----------------------------------------------------------------------
+        # Union-find over the variables of the exists constraints, whatever
+        # the values of their conditions
+        # ----------------------------------------------------------------------
+        parents: dict[tuple[str, str], tuple[str, str]] = {}
+
+        def find(var: tuple[str, str]) -> tuple[str, str]:
+            root: tuple[str, str] = parents.setdefault(var, var)
+            while parents[root] != root:
+                root = parents[root]
+            while parents[var] != root:
+                parents[var], var = root, parents[var]
+            return root
+
+        cids_variables: dict[int, list[tuple[str, str]]] = {
+            cid: [
+                (pid, var)
+                for terms in expr.values()
+                for _, var in terms
+            ]
+            for cid, (_, pid, expr, _, _) in self.cids_constraints.items()
+        }
+        for cid, variables in cids_variables.items():
+            if self.cids_constraints[cid][0] != 'exists' \
+                    or len(variables) == 0:
+                continue
+            root: tuple[str, str] = find(variables[0])
+            for var in variables[1:]:
+                root_: tuple[str, str] = find(var)
+                if root_ != root:
+                    parents[root_] = root
+        for cid, variables in cids_variables.items():
+            self.cids_components[cid] = {find(var) for var in variables}
+
+    def __add_static_equality(self: LpSolver, init: PropagateInit,
+                              atom: TheoryAtom,
+                              static_equalities: dict[str, list[tuple[int,
+                                                                      Row]]]) \
+            -> None:
+        # ----------------------------------------------------------------------
+        # Equality constraints whose literal and conditions are fixed at init
+        # ----------------------------------------------------------------------
+        sid: int = init.solver_literal(atom.literal)
+        if not init.assignment.is_fixed(sid) \
+                or not init.assignment.is_true(sid):
+            return
+        condids: list[int] = []
+        for element in atom.elements:
+            scondid: int = init.solver_literal(element.condition_id)
+            if not init.assignment.is_fixed(scondid):
+                return
+            if init.assignment.is_true(scondid):
+                condids.append(element.condition_id)
+        for cid in (atom.literal, -atom.literal):
+            if cid not in self.cids_constraints:
+                continue
+            ctype, pid, _, sense, bound = self.cids_constraints[cid]
+            if ctype != 'exists' or sense != '=':
+                continue
+            _, (_, expr, _, _) = self.__get_constraints(cid, condids)
+            static_equalities.setdefault(pid, []).append(
+                (cid, (expr, sense, bound))
+            )
+
+    def __void_conditions(self: LpSolver,
+                          constraints: list[ParsedLpConstraint]) -> set[int]:
+        # ----------------------------------------------------------------------
+        # Conditions whose terms cancel out in every linear constraint
+        # ----------------------------------------------------------------------
+        void_condids: set[int] = set(constraints[0][2].keys())
+        for _, _, expr, _, _ in constraints:
+            for condid, terms in expr.items():
+                coeffs: dict[str, float] = {}
+                for coeff, var in terms:
+                    coeffs[var] = coeffs.get(var, 0) + coeff
+                if any(coeff != 0 for coeff in coeffs.values()):
+                    void_condids.discard(condid)
+        return void_condids
 
     # ==========================================================================
     # LP problem builders
@@ -128,10 +338,14 @@ class LpSolver:
         propagate_constraints: dict[str, list[tuple[int,
                                                     LpConstraint,
                                                     int]]] = {}
+        changed_pids: set[str] = set()
         for cid, value, condid in cids:
             # ------------------------------------------------------------------
             # Update 'guess' status
             # ------------------------------------------------------------------
+            if not self.cids_guessed[cid]:
+                self.pids_unguessed[self.cids_constraints[cid][1]] -= 1
+                changed_pids.add(self.cids_constraints[cid][1])
             self.cids_guessed[cid] = True
             if -cid in self.cids_constraints:
                 self.cids_guessed[-cid] = True
@@ -166,23 +380,136 @@ class LpSolver:
         # Propagate constraints to Lp Models
         # ----------------------------------------------------------------------
         for pid, constraints in propagate_constraints.items():
-            if pid not in self.models:
-                self.models[pid] = self.lpsolver_interface(
-                    self.lpsolver, pid, cache=self.__cache
-                )
-                if pid in self.statistics:
-                    self.models[pid].logger = self.statistics[pid]
-                    del self.statistics[pid]
+            is_new: bool = pid not in self.models
+            is_cloned: bool = False
+            if is_new:
+                constraints, is_cloned = self.__init_model(pid, constraints)
             self.models[pid].update(constraints)
-            self.pids_checked_exists[pid] = False
-            self.pids_checked_forall[pid] = False
+            if is_new and not is_cloned:
+                self.__add_template(pid)
+            self.__invalidate(
+                pid,
+                {constraint[0] for _, constraint, _ in constraints},
+                is_added=True
+            )
+            self.pids_implied.add(pid)
+        # ----------------------------------------------------------------------
+        # Update the queues of partitions to check
+        # ----------------------------------------------------------------------
+        for pid in changed_pids | propagate_constraints.keys():
+            self.__update_queues(pid)
+
+    def __init_model(self: LpSolver, pid: str,
+                     constraints: list[tuple[int, LpConstraint, int]]) \
+            -> tuple[list[tuple[int, LpConstraint, int]], bool]:
+        # ----------------------------------------------------------------------
+        # Clone the closest template or build the model from scratch
+        # ----------------------------------------------------------------------
+        index, cids = self.__match_template(constraints)
+        is_cloned: bool = index != -1
+        is_reused: bool = not is_cloned and len(self.pool) != 0
+        if is_cloned:
+            template, _, _ = self.templates[index]
+            self.models[pid] = template.clone(pid, cids)
+            constraints = [
+                constraint
+                for constraint in constraints
+                if constraint[0] not in self.models[pid].constraints
+            ]
+        elif is_reused:
+            self.models[pid] = self.pool.pop()
+            self.models[pid].reset(pid)
+        else:
+            self.models[pid] = self.lpsolver_interface(
+                self.lpsolver, pid, cache=self.__cache
+            )
+        if pid in self.statistics:
+            self.models[pid].logger = self.statistics[pid]
+            del self.statistics[pid]
+        self.models[pid].decompose = self.decompose
+        self.models[pid].presolved = self.pids_presolved.get(pid, ({}, set()))
+        self.models[pid].batch_forall = self.batch_forall
+        self.models[pid].dualize = self.dualize
+        self.models[pid].witness_store = self.witness_store
+        self.models[pid].renaming = self.pids_renaming.get(pid, {})
+        if is_cloned:
+            self.models[pid].logger.clones_nb += 1
+        if is_reused:
+            self.models[pid].logger.reuses_nb += 1
+        return constraints, is_cloned
+
+    def __match_template(self: LpSolver,
+                         constraints: list[tuple[int, LpConstraint, int]]) \
+            -> tuple[int, dict[int, int]]:
+        # ----------------------------------------------------------------------
+        # Map the rows of the best template on the new exists constraints
+        # ----------------------------------------------------------------------
+        best_index: int = -1
+        best_cids: dict[int, int] = {}
+        if not self.templates_enabled:
+            return best_index, best_cids
+        new_cids: set[int] = {cid for cid, _, _ in constraints}
+        for i, (template, descriptions, _) in enumerate(self.templates):
+            # ------------------------------------------------------------------
+            # Rows keeping their constraint identifier are mapped first, the
+            # clone renames the others (possibly as a permutation)
+            # ------------------------------------------------------------------
+            cids: dict[int, int] = {}
+            available: dict[int, list[int]] = {
+                description: [tcid for tcid in tcids if tcid not in new_cids]
+                for description, tcids in descriptions.items()
+            }
+            for cid, (ctype, _, _, _), description in constraints:
+                if ctype != 'exists' \
+                        or description in self.descriptions_renamed:
+                    continue
+                if cid in descriptions.get(description, []):
+                    cids[cid] = cid
+                    continue
+                tcids: list[int] = available.get(description, [])
+                if len(tcids) != 0:
+                    cids[tcids.pop()] = cid
+            if len(cids) < TEMPLATE_MIN_ROWS \
+                    or 2 * len(cids) < len(template.constraints):
+                continue
+            if len(cids) > len(best_cids):
+                best_index, best_cids = i, cids
+        return best_index, best_cids
+
+    def __add_template(self: LpSolver, pid: str) -> None:
+        # ----------------------------------------------------------------------
+        # Large partitions built from scratch are stored as templates
+        # ----------------------------------------------------------------------
+        model: ModelInterface = self.models[pid]
+        # ~ Rows eliminated by the presolve are missing from the LP
+        if not self.templates_enabled \
+                or len(model.constraints) < TEMPLATE_MIN_ROWS \
+                or len(model.eliminated) != 0:
+            return
+        descriptions: dict[int, list[int]] = {}
+        for cid in model.constraints:
+            descriptions.setdefault(model.description[cid], []).append(cid)
+        for _, descriptions_, _ in self.templates:
+            if descriptions_ == descriptions:
+                return
+        template: ModelInterface = model.clone(
+            f'template_{len(self.templates)}',
+            {cid: cid for cid in model.constraints}
+        )
+        self.templates.append((template, descriptions, pid))
+        if len(self.templates) > TEMPLATES_MAX:
+            self.templates.pop(0)
 
     def undo(self: LpSolver, cids: list[int]) -> None:
         undo_constraints: dict[str, list[int]] = {}
+        changed_pids: set[str] = set()
         for cid in cids:
             # ------------------------------------------------------------------
             # Update 'guess' status
             # ------------------------------------------------------------------
+            if self.cids_guessed[cid]:
+                self.pids_unguessed[self.cids_constraints[cid][1]] += 1
+                changed_pids.add(self.cids_constraints[cid][1])
             self.cids_guessed[cid] = False
             if -cid in self.cids_constraints:
                 self.cids_guessed[-cid] = False
@@ -201,11 +528,77 @@ class LpSolver:
         # ----------------------------------------------------------------------
         for pid, constraints in undo_constraints.items():
             self.models[pid].remove(constraints)
-            self.pids_checked_exists[pid] = False
-            self.pids_checked_forall[pid] = False
+            self.__invalidate(
+                pid,
+                {self.cids_constraints[cid][0] for cid in constraints},
+                is_added=False
+            )
+            self.pids_implied.add(pid)
             if self.models[pid].is_empty():
                 self.statistics[pid] = self.models[pid].logger
-                del self.models[pid]
+                model: ModelInterface = self.models.pop(pid)
+                if len(self.pool) < self.pool_size:
+                    self.pool.append(model)
+        # ----------------------------------------------------------------------
+        # Update the queues of partitions to check
+        # ----------------------------------------------------------------------
+        for pid in changed_pids | undo_constraints.keys():
+            self.__update_queues(pid)
+
+    def fix(self: LpSolver, cids: list[int]) -> None:
+        # ----------------------------------------------------------------------
+        # Constraints fixed at decision level 0 are never undone
+        # ----------------------------------------------------------------------
+        static_constraints: dict[str, list[int]] = {}
+        for cid in cids:
+            for cid_ in (cid, -cid):
+                if not self.cids_propagated.get(cid_, False):
+                    continue
+                pid: str = self.cids_constraints[cid_][1]
+                static_constraints.setdefault(pid, []).append(cid_)
+        for pid, constraints in static_constraints.items():
+            self.models[pid].fix(constraints)
+
+    def __invalidate(self: LpSolver, pid: str, ctypes: set[str],
+                     is_added: bool) -> None:
+        # ----------------------------------------------------------------------
+        # Only re-check the partitions whose results may have changed:
+        # ~ removing exists rows keeps a satisfiable partition satisfiable
+        # ~ adding exists rows or removing forall constraints keeps the forall
+        #   constraints valid, the minimum over a smaller domain can only
+        #   increase
+        # ----------------------------------------------------------------------
+        logger: Logger = self.models[pid].logger
+        if 'exists' in ctypes:
+            if is_added or not self.pids_sat_exists.get(pid, False):
+                self.pids_checked_exists[pid] = False
+            elif self.pids_checked_exists[pid]:
+                logger.skipped_exists_nb += 1
+        if 'exists' in ctypes or 'forall' in ctypes:
+            is_relaxed: bool = not is_added and 'exists' in ctypes \
+                or is_added and 'forall' in ctypes
+            if is_relaxed or not self.pids_valid_forall.get(pid, False):
+                self.pids_checked_forall[pid] = False
+            elif self.pids_checked_forall[pid]:
+                logger.skipped_forall_nb += 1
+        self.pids_checked_exists.setdefault(pid, False)
+        self.pids_checked_forall.setdefault(pid, False)
+
+    def __update_queues(self: LpSolver, pid: str) -> None:
+        # ----------------------------------------------------------------------
+        # A partition is checked if it is completed and has been modified
+        # ----------------------------------------------------------------------
+        is_completed: bool = pid in self.models \
+            and self.pids_unguessed[pid] == 0
+        if is_completed and not self.pids_checked_exists[pid]:
+            self.pids_queue_exists[pid] = None
+        else:
+            self.pids_queue_exists.pop(pid, None)
+        if is_completed and pid in self.models_forall \
+                and not self.pids_checked_forall[pid]:
+            self.pids_queue_forall[pid] = None
+        else:
+            self.pids_queue_forall.pop(pid, None)
 
     # ==========================================================================
     # LP problem solvers
@@ -213,11 +606,30 @@ class LpSolver:
 
     def check_exists(self: LpSolver) -> list[list[int]]:
         core_conflicts: list[list[int]] = []
-        for pid in self.get_pids(only_completed=True):
-            if self.pids_checked_exists[pid]:
-                continue
-            sat: bool = self.models[pid].check_exists()
+        # ----------------------------------------------------------------------
+        # Exists constraints are monotone: every partial partition can be
+        # checked, once every `partial_exists` rounds
+        # ----------------------------------------------------------------------
+        pids: list[str] = list(self.pids_queue_exists)
+        if self.partial_exists > 0:
+            self.partial_exists_rounds += 1
+            if self.partial_exists_rounds >= self.partial_exists:
+                self.partial_exists_rounds = 0
+                pids = [
+                    pid
+                    for pid in self.models
+                    if not self.pids_checked_exists[pid]
+                ]
+                for pid in pids:
+                    if self.pids_unguessed[pid] != 0:
+                        self.models[pid].logger.partial_checks_nb += 1
+        batched: dict[str, bool] = self.__check_exists_batch(pids)
+        for pid in pids:
+            sat: bool = batched[pid] if pid in batched \
+                else self.models[pid].check_exists()
             self.pids_checked_exists[pid] = True
+            self.pids_sat_exists[pid] = sat
+            self.pids_queue_exists.pop(pid, None)
             if not sat:
                 conflict: list[int] = self.models[pid].core_unsat_exists()
                 if self.strict_forall:
@@ -225,15 +637,126 @@ class LpSolver:
                 core_conflicts.append(conflict)
         return core_conflicts
 
+    def __check_exists_batch(self: LpSolver,
+                             pids: list[str]) -> dict[str, bool]:
+        results: dict[str, bool] = {}
+        if self.batch_rows <= 0:
+            return results
+        # ----------------------------------------------------------------------
+        # Small partitions missing from the cache (and from the witnesses) are
+        # solved together, the decomposed ones are checked by components
+        # ----------------------------------------------------------------------
+        blocks: list[str] = []
+        for pid in pids:
+            model: ModelInterface = self.models[pid]
+            if len(model.description) > self.batch_rows or model.decompose:
+                continue
+            cache_check: None | bool = model.check_exists_cache()
+            if cache_check is not None:
+                results[pid] = cache_check
+            else:
+                blocks.append(pid)
+        if len(blocks) == 1:
+            results[blocks[0]] = self.models[blocks[0]].solve_exists()
+        elif len(blocks) > 1:
+            self.__solve_batch(blocks, False, results)
+        return results
+
+    def __solve_batch(self: LpSolver, blocks: list[str], is_infeasible: bool,
+                      results: dict[str, bool]) -> bool:
+        # ----------------------------------------------------------------------
+        # An infeasible stack is bisected: if a half is feasible, the other one
+        # is infeasible without being solved
+        # ----------------------------------------------------------------------
+        if len(blocks) == 1:
+            model: ModelInterface = self.models[blocks[0]]
+            if is_infeasible:
+                model.set_exists(False)
+                model.logger.batched_checks_nb += 1
+                results[blocks[0]] = False
+            else:
+                results[blocks[0]] = model.solve_exists()
+            return results[blocks[0]]
+        if not is_infeasible and self.__solve_stack(blocks, results):
+            return True
+        half: int = len(blocks) // 2
+        is_feasible: bool = self.__solve_batch(blocks[:half], False, results)
+        self.__solve_batch(blocks[half:], is_feasible, results)
+        return False
+
+    def __solve_stack(self: LpSolver, blocks: list[str],
+                      results: dict[str, bool]) -> bool:
+        # ----------------------------------------------------------------------
+        # Stack the blocks: the variables of each block are renamed apart
+        # ----------------------------------------------------------------------
+        if self.batch_model is None:
+            self.batch_model = self.lpsolver_interface(
+                self.lpsolver, 'batch', cache=self.batch_cache
+            )
+        else:
+            self.batch_model.reset('batch')
+        self.batch_model.logger = self.batch_logger
+        rows: list[tuple[int, LpConstraint, int]] = []
+        for i, pid in enumerate(blocks):
+            model: ModelInterface = self.models[pid]
+            for cid, description in model.description.items():
+                expr, sense, b = model.rows[cid]
+                rows.append((
+                    len(rows) + 1,
+                    (
+                        'exists',
+                        [(coeff, f'b{i}_{var}') for coeff, var in expr],
+                        sense,
+                        b
+                    ),
+                    hash((i, description))
+                ))
+        self.batch_model.update(rows)
+        # ----------------------------------------------------------------------
+        # The cost of the stacked LP is split between the blocks
+        # ----------------------------------------------------------------------
+        # ~ A solved stacked LP is counted once, by its first block
+        dt: float = time()
+        is_feasible: bool = self.batch_model.check_exists()
+        share: float = (time() - dt) / len(blocks)
+        for pid in blocks:
+            self.models[pid].logger.batched_checks_sum += share
+        is_solved: bool = \
+            self.batch_model.logger.lpsolver_calls_nb != self.batch_calls
+        self.batch_calls = self.batch_model.logger.lpsolver_calls_nb
+        if is_solved:
+            self.models[blocks[0]].logger.batched_lps_nb += 1
+        if not is_feasible:
+            return False
+        # ----------------------------------------------------------------------
+        # A feasible stacked LP makes every block feasible: the solution of
+        # each block is a witness if the stacked LP was solved
+        # ----------------------------------------------------------------------
+        assignment: dict[str, float | None] = {}
+        if is_solved:
+            assignment = self.batch_model.get_assignment()
+        for i, pid in enumerate(blocks):
+            model = self.models[pid]
+            witness: dict[str, float] | None = None
+            if len(assignment) != 0:
+                values: dict[str, float | None] = {
+                    var: assignment.get(f'b{i}_{var}', 0.)
+                    for var in model.variables
+                }
+                if None not in values.values():
+                    witness = values  # type: ignore
+            model.set_exists(True, witness)
+            model.logger.batched_checks_nb += 1
+            results[pid] = True
+        return True
+
     def check_forall(self: LpSolver) -> list[tuple[int, list[int], list[int]]]:
         core_conflicts: list[tuple[int, list[int], list[int]]] = []
-        for pid in self.get_pids(only_completed=True):
-            if pid not in self.models_forall:
-                continue
-            if self.pids_checked_forall[pid]:
-                continue
+        for pid in list(self.pids_queue_forall):
             unsat_cid: list[int] = self.models[pid].check_forall()
             self.pids_checked_forall[pid] = True
+            self.pids_valid_forall[pid] = len(unsat_cid) == 0
+            del self.pids_queue_forall[pid]
             if len(unsat_cid) > 0:
                 prop_cids: list[int] = self.get_constraints(
                     pid,
@@ -247,17 +770,98 @@ class LpSolver:
                 }
                 conflicts: list[tuple[int, list[int], list[int]]] = []
                 for conflict in unsat_cid:
+                    prop_cids_: list[int] = prop_cids
+                    unprop_cids_: dict[int, list[tuple[LpConstraint,
+                                                       int]]] = unprop_cids
+                    if self.minimize:
+                        prop_cids_, unprop_cids_ = self.__restrict_forall(
+                            conflict, prop_cids, unprop_cids
+                        )
                     conflicts.append((
                         abs(conflict),
-                        prop_cids,
+                        prop_cids_,
                         self.models[pid].core_unsat_forall(
                             conflict,
-                            unprop_cids
+                            unprop_cids_
                         )
                     ))
                 core_conflicts.extend(conflicts)
         return core_conflicts
 
+    def __restrict_forall(self: LpSolver, conflict: int,
+                          prop_cids: list[int],
+                          unprop_cids: dict[int, list[tuple[LpConstraint,
+                                                            int]]]) \
+            -> tuple[list[int], dict[int, list[tuple[LpConstraint, int]]]]:
+        # ----------------------------------------------------------------------
+        # The certificate of a violation (a minimizer and the multipliers of
+        # its optimum) only involves the rows connected to the objective by
+        # their variables. The other rows can not change the minimum whatever
+        # their conditions: if they make the partition infeasible, the exists
+        # check rejects the assignment anyway
+        # ----------------------------------------------------------------------
+        components: set[tuple[str, str]] = self.cids_components[conflict]
+
+        def is_connected(cid: int) -> bool:
+            return any(
+                not components.isdisjoint(self.cids_components[cid_])
+                for cid_ in (cid, -cid)
+                if cid_ in self.cids_components
+            )
+
+        return [cid for cid in prop_cids if is_connected(cid)], {
+            cid: constraints
+            for cid, constraints in unprop_cids.items()
+            if is_connected(cid)
+        }
+
+    # ==========================================================================
+    # LP theory propagation
+    # ==========================================================================
+
+    def propagate_implied(self: LpSolver,
+                          cids: list[tuple[int, list[int]]],
+                          budget: int) -> list[list[int]]:
+        # ----------------------------------------------------------------------
+        # Group the candidate constraints by partitions
+        # ----------------------------------------------------------------------
+        candidates: dict[str, list[list[tuple[int, LpConstraint, int]]]] = {}
+        for cid, condids in cids:
+            constraints: list[tuple[int, LpConstraint, int]] = []
+            pid: str = self.cids_constraints[cid][1]
+            for cid_ in (cid, -cid):
+                if cid_ not in self.cids_constraints:
+                    continue
+                _, constraint = self.__get_constraints(cid_, condids)
+                description: int = self.__get_description(cid_, condids)
+                constraints.append((cid_, constraint, description))
+            candidates.setdefault(pid, []).append(constraints)
+        # ----------------------------------------------------------------------
+        # Propagate the constraints that would make a partition infeasible
+        # ----------------------------------------------------------------------
+        implied: list[list[int]] = []
+        for pid, pid_candidates in candidates.items():
+            if pid not in self.models:
+                continue
+            for conflict in self.models[pid].propagate_implied(
+                    pid_candidates, budget):
+                if self.strict_forall:
+                    conflict += self.models_forall.get(pid, [])
+                implied.append(conflict)
+        return implied
+
+    def get_implied_candidates(self: LpSolver) -> list[int]:
+        candidates: list[int] = [
+            cid
+            for pid in self.pids_implied
+            if pid in self.models
+            for cid in self.pids[pid]
+            if not self.cids_guessed[cid]
+            and self.cids_constraints[cid][0] == 'exists'
+        ]
+        self.pids_implied.clear()
+        return candidates
+
     # ==========================================================================
     # Getters
     # ==========================================================================
@@ -272,7 +876,16 @@ class LpSolver:
 
     def __get_description(self: LpSolver, cid: int,
                           condids: list[int]) -> int:
-        _, (ctype, expr_, sense, bound) = self.__get_constraints(cid, condids)
+        pid, (ctype, expr_, sense, bound) = \
+            self.__get_constraints(cid, condids)
+        is_renamed: bool = False
+        if len(self.pids_renaming.get(pid, {})) != 0:
+            canonical_expr: list[tuple[float, str]] = [
+                (coeff, self.__canonical_variable(pid, var))
+                for coeff, var in expr_
+            ]
+            is_renamed = canonical_expr != expr_
+            expr_ = canonical_expr
         expr_str: str = ' + '.join(
             f'{coeff} * {var}'
             for coeff, var in sorted(expr_)
@@ -281,18 +894,22 @@ class LpSolver:
             ctype,
             f'{expr_str} {sense} {bound}'
         )
+        if is_renamed:
+            self.descriptions_renamed.add(hash(description))
         return hash(description)
 
+    def __canonical_variable(self: LpSolver, pid: str, var: str) -> str:
+        key: tuple[str, str] = (pid, var)
+        if key not in self.canonical_variables:
+            self.canonical_variables[key] = \
+                canonical_variable(var, self.pids_renaming[pid])
+        return self.canonical_variables[key]
+
     def get_pids(self: LpSolver, only_completed: bool = False) -> list[str]:
-        def is_completed(pid: str) -> bool:
-            for cid in self.pids[pid]:
-                if not self.cids_guessed[cid]:
-                    return False
-            return True
         return [
             pid
             for pid in self.models
-            if not only_completed or is_completed(pid)
+            if not only_completed or self.pids_unguessed[pid] == 0
         ]
 
     def get_constraints(self: LpSolver, pid: str,
@@ -310,6 +927,11 @@ class LpSolver:
             if -cid not in self.models_forall[pid]
         ]
 
+    def get_logger(self: LpSolver, pid: str) -> Logger | None:
+        if pid in self.models:
+            return self.models[pid].logger
+        return self.statistics.get(pid, None)
+
     def get_statistics(self: LpSolver,
                        pid: str | None = None) -> list[Logger]:
         if pid is not None:
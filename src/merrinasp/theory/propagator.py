@@ -15,6 +15,13 @@ from clingo import (
 )
 
 from merrinasp.theory.lra.logger import Logger
+from merrinasp.theory.lra.nogoods import NogoodStore
+from merrinasp.theory.lra.scheduler import (
+    LpScheduler,
+    Policy,
+    WATCHES_INTERVAL,
+    is_lazy_partition
+)
 from merrinasp.theory.lra.solver import LpSolver
 
 # ==============================================================================
@@ -29,17 +36,46 @@ class LpPropagator:
         # Parameters
         # ----------------------------------------------------------------------
         self.__islazy: bool = False
+        self.__isadaptive: bool = False
+        self.__isshared: bool = False
+        self.__islocked: bool = True
+        self.__isminimized: bool = False
+        self.__istemplated: bool = False
+        self.__model_pool: int = 0
+        self.__isdecomposed: bool = False
+        self.__ispresolved: bool = False
+        self.__isbatched: bool = False
+        self.__isdualized: bool = False
+        self.__iswitnessed: bool = False
+        self.__isincremental: bool = False
+        self.__issymmetric: bool = False
+        self.__batch_partitions: int = 0
         self.__isstrictforall: bool = False
         self.__show_lpassignment: bool = False
+        self.__propagation_budget: int = 0
+        self.__partial_exists: int = 0
+        self.__check_policy: Policy = 'eager'
+        self.__check_parameter: float = 0
         self.__lpsolver: str = lpsolver
         # ----------------------------------------------------------------------
         # Checkers
         # ----------------------------------------------------------------------
         self.__checkers: list[LpChecker] = []
+        self.__schedulers: list[LpScheduler] = []
+        # ----------------------------------------------------------------------
+        # Constraints to add (one queue per thread)
+        # ----------------------------------------------------------------------
+        self.__waiting_nogoods: list[list[list[int]]] = []
+        self.__shared_nogoods: list[list[list[int]]] = []
+        self.__stores: list[NogoodStore] = []
+        # ~ Clauses added before init: queued once the atoms are mapped
+        self.__clauses: list[list[tuple[str, bool]]] = []
         # ----------------------------------------------------------------------
-        # Constraints to add
+        # Sharing statistics (one counter per thread)
         # ----------------------------------------------------------------------
-        self.__waiting_nogoods: list[list[int]] = []
+        self.__nogoods_shared: list[int] = []
+        self.__nogoods_received: list[int] = []
+        self.__nogoods_useful: list[int] = []
         # ----------------------------------------------------------------------
         # Atoms map
         # ----------------------------------------------------------------------
@@ -66,9 +102,41 @@ class LpPropagator:
                 init,
                 lazy=self.__islazy,
                 lpsolver=self.__lpsolver,
-                is_strict_forall=self.__isstrictforall
+                is_strict_forall=self.__isstrictforall,
+                partial_exists=self.__partial_exists,
+                adaptive=self.__isadaptive and not self.__islazy,
+                minimize=self.__isminimized,
+                templates=self.__istemplated,
+                model_pool=self.__model_pool,
+                decompose=self.__isdecomposed,
+                presolve=self.__ispresolved,
+                batch_forall=self.__isbatched,
+                dualize=self.__isdualized,
+                witness_store=self.__iswitnessed,
+                incremental=self.__isincremental,
+                symmetric=self.__issymmetric,
+                batch_partitions=self.__batch_partitions
             )
             self.__checkers.append(optChecker)
+        # ----------------------------------------------------------------------
+        # Init check schedulers
+        # ----------------------------------------------------------------------
+        self.__schedulers = [
+            LpScheduler(self.__check_policy, self.__check_parameter)
+            for _ in range(init.number_of_threads)
+        ]
+        # ----------------------------------------------------------------------
+        # Init nogoods queues
+        # ----------------------------------------------------------------------
+        self.__waiting_nogoods = [[] for _ in range(init.number_of_threads)]
+        self.__shared_nogoods = [[] for _ in range(init.number_of_threads)]
+        self.__stores = [NogoodStore() for _ in range(init.number_of_threads)]
+        self.__nogoods_shared = [0 for _ in range(init.number_of_threads)]
+        self.__nogoods_received = [0 for _ in range(init.number_of_threads)]
+        self.__nogoods_useful = [0 for _ in range(init.number_of_threads)]
+        for clause in self.__clauses:
+            self.__queue_clause(clause)
+        self.__clauses.clear()
 
     def undo(self: LpPropagator, thread_id: int,
              _: Assignment, changes: list[int]) -> None:
@@ -80,20 +148,42 @@ class LpPropagator:
         # Check LP constraints
         # ----------------------------------------------------------------------
         lp_checker: LpChecker = self.__checkers[control.thread_id]
+        lp_checker.release(control, changes)
         lp_checker.propagate(control, changes)
+        if control.assignment.decision_level == 0:
+            lp_checker.fix(control, changes)
+        lp_checker.adapt_watches(control)
         # ----------------------------------------------------------------------
         # Add waiting nogoods
         # ----------------------------------------------------------------------
         if not self.__apply_nogoods(control):
             return
+        # ----------------------------------------------------------------------
+        # Skip the check if not scheduled (partitions stay marked as unchecked)
+        # ----------------------------------------------------------------------
+        scheduler: LpScheduler = self.__schedulers[control.thread_id]
+        if not scheduler.should_check(control.assignment.decision_level):
+            return
+        dt: float = time()
         nogoods: list[list[int]] | None = lp_checker.check()
+        scheduler.notify(bool(nogoods), time() - dt)
         # ----------------------------------------------------------------------
         # Added and apply newly nogoods
         # ----------------------------------------------------------------------
         if nogoods is not None and len(nogoods) != 0:
-            self.__waiting_nogoods.extend(nogoods)
+            self.__add_nogoods(control.thread_id, nogoods)
             if not self.__apply_nogoods(control):
                 return
+        # ----------------------------------------------------------------------
+        # Propagate the unassigned LP constraints
+        # ----------------------------------------------------------------------
+        if self.__propagation_budget > 0:
+            reasons: list[list[int]] = lp_checker.propagate_implied(
+                control, self.__propagation_budget
+            )
+            for reason in reasons:
+                if not control.add_nogood(reason) or not control.propagate():
+                    return
 
     def check(self: LpPropagator, control: PropagateControl) -> None:
         # ----------------------------------------------------------------------
@@ -105,41 +195,110 @@ class LpPropagator:
         # Compute changes
         # ----------------------------------------------------------------------
         lp_checker: LpChecker = self.__checkers[control.thread_id]
+        lp_checker.release(control, [])
         changes: list[int] = lp_checker.unguess(control)
         # ----------------------------------------------------------------------
         # Check LP constraints
         # ----------------------------------------------------------------------
         lp_checker.propagate(control, changes)
+        changes = lp_checker.fix(control, changes)
         nogoods: list[list[int]] | None = lp_checker.check()
         if self.__show_lpassignment:
             lp_checker.compute_assignment()
-        lp_checker.undo(changes)
+        lp_checker.keep(control, changes)
         # ----------------------------------------------------------------------
         # Added and apply newly nogoods
         # ----------------------------------------------------------------------
         if nogoods is not None and len(nogoods) != 0:
-            self.__waiting_nogoods.extend(nogoods)
+            self.__add_nogoods(control.thread_id, nogoods)
             if not self.__apply_nogoods(control):
                 return
 
     # --------------------------------------------------------------------------
     # Model refiners
     # --------------------------------------------------------------------------
+    def __add_nogoods(self: LpPropagator, thread_id: int,
+                      nogoods: list[list[int]]) -> None:
+        self.__waiting_nogoods[thread_id].extend(nogoods)
+        if not self.__isshared:
+            return
+        # ----------------------------------------------------------------------
+        # Broadcast the LP conflicts to the other threads
+        # ----------------------------------------------------------------------
+        for other_id, shared_nogoods in enumerate(self.__shared_nogoods):
+            if other_id != thread_id:
+                shared_nogoods.extend(nogoods)
+        self.__nogoods_shared[thread_id] += len(nogoods)
+
     def __apply_nogoods(self: LpPropagator, control: PropagateControl) -> bool:
-        while len(self.__waiting_nogoods) != 0:
-            nogood: list[int] = self.__waiting_nogoods.pop()
-            if not control.add_nogood(nogood, lock=True):
+        thread_id: int = control.thread_id
+        # ----------------------------------------------------------------------
+        # Nogoods found by the current thread
+        # ----------------------------------------------------------------------
+        waiting_nogoods: list[list[int]] = self.__waiting_nogoods[thread_id]
+        while len(waiting_nogoods) != 0:
+            nogood: list[int] = waiting_nogoods.pop()
+            if not self.__add_nogood(control, nogood):
+                return False
+        # ----------------------------------------------------------------------
+        # Nogoods shared by the other threads
+        # ----------------------------------------------------------------------
+        shared_nogoods: list[list[int]] = self.__shared_nogoods[thread_id]
+        while len(shared_nogoods) != 0:
+            nogood = shared_nogoods.pop()
+            self.__nogoods_received[thread_id] += 1
+            if self.__is_asserting(control.assignment, nogood):
+                self.__nogoods_useful[thread_id] += 1
+            if not self.__add_nogood(control, nogood):
+                return False
+        return True
+
+    def __add_nogood(self: LpPropagator, control: PropagateControl,
+                     nogood: list[int]) -> bool:
+        # ----------------------------------------------------------------------
+        # Locked nogoods are never removed by clingo: skip the redundant ones
+        # ----------------------------------------------------------------------
+        if self.__islocked:
+            store: NogoodStore = self.__stores[control.thread_id]
+            if not store.add(nogood):
+                return True
+        return control.add_nogood(nogood, lock=self.__islocked)
+
+    def __is_asserting(self: LpPropagator, assignment: Assignment,
+                       nogood: list[int]) -> bool:
+        # ----------------------------------------------------------------------
+        # A nogood is useful if it is conflicting or unit
+        # ----------------------------------------------------------------------
+        unassigned: int = 0
+        for literal in nogood:
+            value: bool | None = assignment.value(literal)
+            if value is False:
                 return False
+            if value is None:
+                unassigned += 1
+                if unassigned > 1:
+                    return False
         return True
 
     def add_clause(self: LpPropagator,
                    clause: Iterable[tuple[str, bool]]) -> None:
+        # ----------------------------------------------------------------------
+        # The nogoods queues and the atoms map only exist after init
+        # ----------------------------------------------------------------------
+        if len(self.__checkers) == 0:
+            self.__clauses.append(list(clause))
+            return
+        self.__queue_clause(clause)
+
+    def __queue_clause(self: LpPropagator,
+                       clause: Iterable[tuple[str, bool]]) -> None:
         clause_sid: list[int] = []
         for atom_str, value in clause:
             assert atom_str in self.__symbolic_atoms
             literal: int = self.__symbolic_atoms[atom_str]
             clause_sid.append(-literal if value else literal)
-        self.__waiting_nogoods.append(clause_sid)
+        for waiting_nogoods in self.__waiting_nogoods:
+            waiting_nogoods.append(clause_sid)
 
     # --------------------------------------------------------------------------
     # Getters
@@ -157,6 +316,7 @@ class LpPropagator:
                                                     dict[str, float] | float]:
         preprocessing_times: list[float] = [0]
         all_loggers: list[Logger] = []
+        thread_ids: list[int] = list(range(len(self.__checkers)))
         # ----------------------------------------------------------------------
         # Extract logs
         # ----------------------------------------------------------------------
@@ -165,6 +325,7 @@ class LpPropagator:
             preprocessing_time, loggers = checker.get_statistics()
             preprocessing_times.append(preprocessing_time)
             all_loggers.extend(loggers)
+            thread_ids = [thread_ids[thread_id]]
         else:
             for checker in self.__checkers:
                 preprocessing_time, loggers = checker.get_statistics()
@@ -176,6 +337,18 @@ class LpPropagator:
         statistics: dict[str, dict[str, float] | float] = {
             'Preprocessing (s)': sum(preprocessing_times)
         } | Logger.merge(all_loggers)
+        statistics['Nogoods'] = {
+            'Shared': sum(self.__nogoods_shared[i] for i in thread_ids),
+            'Received': sum(self.__nogoods_received[i] for i in thread_ids),
+            'Useful': sum(self.__nogoods_useful[i] for i in thread_ids),
+            'Added': sum(self.__stores[i].added_nb for i in thread_ids),
+            'Duplicates': sum(self.__stores[i].duplicates_nb for i in thread_ids),
+            'Subsumed': sum(self.__stores[i].subsumed_nb for i in thread_ids)
+        }
+        statistics['Scheduler'] = {
+            'Checks': sum(self.__schedulers[i].checks_nb for i in thread_ids),
+            'Skipped': sum(self.__schedulers[i].skipped_nb for i in thread_ids)
+        }
         return statistics
 
     # --------------------------------------------------------------------------
@@ -184,12 +357,65 @@ class LpPropagator:
     def lazy(self: LpPropagator, is_lazy: bool) -> None:
         self.__islazy = is_lazy
 
+    def adaptive_watches(self: LpPropagator, is_adaptive: bool) -> None:
+        self.__isadaptive = is_adaptive
+
+    def share_conflicts(self: LpPropagator, is_shared: bool) -> None:
+        self.__isshared = is_shared
+
+    def lock_nogoods(self: LpPropagator, is_locked: bool) -> None:
+        self.__islocked = is_locked
+
+    def minimize_nogoods(self: LpPropagator, is_minimized: bool) -> None:
+        self.__isminimized = is_minimized
+
+    def partition_templates(self: LpPropagator, is_templated: bool) -> None:
+        self.__istemplated = is_templated
+
+    def model_pool(self: LpPropagator, size: int) -> None:
+        self.__model_pool = size
+
+    def decompose_partitions(self: LpPropagator, is_decomposed: bool) -> None:
+        self.__isdecomposed = is_decomposed
+
+    def nullspace_presolve(self: LpPropagator, is_presolved: bool) -> None:
+        self.__ispresolved = is_presolved
+
+    def batch_forall(self: LpPropagator, is_batched: bool) -> None:
+        self.__isbatched = is_batched
+
+    def dualize_forall(self: LpPropagator, is_dualized: bool) -> None:
+        self.__isdualized = is_dualized
+
+    def witness_store(self: LpPropagator, is_witnessed: bool) -> None:
+        self.__iswitnessed = is_witnessed
+
+    def incremental_check(self: LpPropagator, is_incremental: bool) -> None:
+        self.__isincremental = is_incremental
+
+    def symmetric_partitions(self: LpPropagator, is_symmetric: bool) -> None:
+        self.__issymmetric = is_symmetric
+
+    def batch_partitions(self: LpPropagator, rows: int) -> None:
+        self.__batch_partitions = rows
+
     def show_lpassignment(self: LpPropagator, show: bool) -> None:
         self.__show_lpassignment = show
 
     def strict_forall_check(self: LpPropagator, is_strict: bool) -> None:
         self.__isstrictforall = is_strict
 
+    def lp_propagation(self: LpPropagator, budget: int) -> None:
+        self.__propagation_budget = budget
+
+    def partial_exists_check(self: LpPropagator, frequency: int) -> None:
+        self.__partial_exists = frequency
+
+    def check_policy(self: LpPropagator, policy: Policy,
+                     parameter: float = 0) -> None:
+        self.__check_policy = policy
+        self.__check_parameter = parameter
+
 
 # ==============================================================================
 # Checker
@@ -198,13 +424,25 @@ class LpChecker:
 
     def __init__(self: LpChecker, init: PropagateInit, lazy: bool = False,
                  lpsolver: str = 'glpk',
-                 is_strict_forall: bool = False) -> None:
+                 is_strict_forall: bool = False,
+                 partial_exists: int = 0, adaptive: bool = False,
+                 minimize: bool = False, templates: bool = False,
+                 model_pool: int = 0, decompose: bool = False,
+                 presolve: bool = False, batch_forall: bool = False,
+                 dualize: bool = False, witness_store: bool = False,
+                 incremental: bool = False, symmetric: bool = False,
+                 batch_partitions: int = 0) -> None:
         self.preprocessing_time: float = time()
         # ----------------------------------------------------------------------
         # Linear problem solvers
         # ----------------------------------------------------------------------
         self.lpsolver: LpSolver = LpSolver(
-            init, lpsolver, strict_forall=is_strict_forall
+            init, lpsolver, strict_forall=is_strict_forall,
+            partial_exists=partial_exists, templates=templates,
+            model_pool=model_pool, decompose=decompose, presolve=presolve,
+            batch_forall=batch_forall, dualize=dualize,
+            witness_store=witness_store, symmetric=symmetric,
+            batch_partitions=batch_partitions, minimize=minimize
         )
         # ----------------------------------------------------------------------
         # Database - Clingo Literals IDs
@@ -220,6 +458,29 @@ class LpChecker:
         # ----------------------------------------------------------------------
         self.cids: dict[int, list[int]] = {}
         self.condids: dict[int, list[int]] = {}
+        self.cids_nogood: dict[int, list[int]] = {}
+
+        # ----------------------------------------------------------------------
+        # Database - Literals fixed at decision level 0
+        # ----------------------------------------------------------------------
+        self.sids_fixed: set[int] = set()
+
+        # ----------------------------------------------------------------------
+        # Database - Literals kept from the previous total assignment
+        # ----------------------------------------------------------------------
+        # ~ The rows of the unwatched literals are kept between two checks and
+        #   only the literals whose value changed are undone
+        self.incremental: bool = incremental
+        self.sids_kept: dict[int, bool] = {}
+
+        # ----------------------------------------------------------------------
+        # Database - Watched literals of each partition
+        # ----------------------------------------------------------------------
+        self.adaptive: bool = adaptive
+        self.propagations: int = 0
+        self.sids_pids: dict[int, set[str]] = {}
+        self.sids_watched: set[int] = set()
+        self.pids_lazy: set[str] = set()
 
         # ----------------------------------------------------------------------
         # Initialize internal memory
@@ -230,6 +491,8 @@ class LpChecker:
             # ------------------------------------------------------------------
             cid: int = atom.literal
             sid: int = init.solver_literal(cid)
+            pid: str = str(atom.term.arguments[0])
+            self.sids_pids.setdefault(sid, set()).add(pid)
             self.sids_cids.setdefault(sid, set()).add(cid)
             self.cids_sid[cid] = sid
             self.cids.setdefault(cid, [])
@@ -242,12 +505,24 @@ class LpChecker:
             for element in atom.elements:
                 condid: int = element.condition_id
                 scondid: int = init.solver_literal(condid)
+                self.sids_pids.setdefault(scondid, set()).add(pid)
                 self.sids_cids.setdefault(scondid, set()).add(condid)
                 self.cids_sid[condid] = scondid
                 self.cids[cid].append(condid)
                 self.condids.setdefault(condid, []).append(cid)
                 self.cids_guess[condid] = False
                 self.cids_value[condid] = False
+            # ------------------------------------------------------------------
+            # Conditions involved in the nogoods: when minimizing, the
+            # conditions whose terms cancel out in every linear constraint of
+            # the atom are skipped (the LP solver also restricts the rows of
+            # the forall conflicts)
+            # ------------------------------------------------------------------
+            self.cids_nogood[cid] = [
+                condid
+                for condid in self.cids[cid]
+                if not minimize or condid not in self.lpsolver.cids_void[cid]
+            ]
 
         # ----------------------------------------------------------------------
         # Declare watch variables
@@ -258,6 +533,7 @@ class LpChecker:
         else:
             for sid in self.sids_cids:
                 init.add_watch(sid)
+            self.sids_watched = set(self.sids_cids)
         self.preprocessing_time = time() - self.preprocessing_time
 
     # ==========================================================================
@@ -313,6 +589,103 @@ class LpChecker:
                 propagate_cids.append((cid, sid_guess, list(condids)))
         self.lpsolver.propagate(propagate_cids)
 
+    def fix(self: LpChecker, control: PropagateControl,
+            changes: list[int]) -> list[int]:
+        # ----------------------------------------------------------------------
+        # Literals fixed at decision level 0 are never undone: stop watching
+        # them and return the other changes
+        # ----------------------------------------------------------------------
+        unfixed_changes: list[int] = []
+        fixed_cids: set[int] = set()
+        for sid in changes:
+            if not control.assignment.is_fixed(sid):
+                unfixed_changes.append(sid)
+                continue
+            value: bool | None = control.assignment.value(sid)
+            self.sids_fixed.add(sid if value else -sid)
+            if sid in self.sids_watched:
+                control.remove_watch(sid)
+                self.sids_watched.discard(sid)
+            self.sids_pids.pop(sid, None)
+            for cid in self.sids_cids[sid]:
+                if cid in self.cids:
+                    fixed_cids.add(cid)
+                if cid in self.condids:
+                    fixed_cids.update(self.condids[cid])
+        # ----------------------------------------------------------------------
+        # Constraints whose literal and conditions are all fixed become static
+        # ----------------------------------------------------------------------
+        static_cids: list[int] = [
+            cid
+            for cid in fixed_cids
+            if self.__cid_fixed(cid) and self.cids_value[cid]
+        ]
+        if len(static_cids) != 0:
+            self.lpsolver.fix(static_cids)
+        return unfixed_changes
+
+    def keep(self: LpChecker, control: PropagateControl,
+             changes: list[int]) -> None:
+        if not self.incremental:
+            self.undo(changes)
+            return
+        for sid in changes:
+            self.sids_kept[sid] = bool(control.assignment.value(sid))
+
+    def release(self: LpChecker, control: PropagateControl,
+                changes: list[int]) -> None:
+        if len(self.sids_kept) == 0:
+            return
+        # ----------------------------------------------------------------------
+        # Kept literals reassigned since the previous check are undone, as well
+        # as the ones about to be propagated
+        # ----------------------------------------------------------------------
+        changed_sids: set[int] = set(changes)
+        released_sids: list[int] = [
+            sid
+            for sid, value in self.sids_kept.items()
+            if sid in changed_sids
+            or control.assignment.value(sid) != value
+        ]
+        for sid in released_sids:
+            del self.sids_kept[sid]
+        if len(released_sids) != 0:
+            self.undo(released_sids)
+
+    def adapt_watches(self: LpChecker, control: PropagateControl) -> None:
+        if not self.adaptive:
+            return
+        self.propagations += 1
+        if self.propagations < WATCHES_INTERVAL:
+            return
+        self.propagations = 0
+        # ----------------------------------------------------------------------
+        # Select the partitions only checked on total assignments
+        # ----------------------------------------------------------------------
+        pids_lazy: set[str] = {
+            pid
+            for pid in self.lpsolver.pids
+            if is_lazy_partition(self.lpsolver.get_logger(pid))
+        }
+        if pids_lazy == self.pids_lazy:
+            return
+        for pid in pids_lazy ^ self.pids_lazy:
+            logger: Logger | None = self.lpsolver.get_logger(pid)
+            if logger is not None:
+                logger.watch_switches_nb += 1
+        self.pids_lazy = pids_lazy
+        # ----------------------------------------------------------------------
+        # A literal is watched if one of its partitions is eager
+        # ----------------------------------------------------------------------
+        for sid, pids in self.sids_pids.items():
+            watched: bool = not pids.issubset(pids_lazy)
+            if watched and sid not in self.sids_watched:
+                control.add_watch(sid)
+                self.sids_watched.add(sid)
+            elif not watched and sid in self.sids_watched:
+                control.remove_watch(sid)
+                self.sids_watched.discard(sid)
+
     def check(self: LpChecker) -> list[list[int]]:
         nogoods: list[list[int]] = []
         nogood: list[int]
@@ -333,6 +706,31 @@ class LpChecker:
             nogoods.append(nogood)
         return nogoods
 
+    def propagate_implied(self: LpChecker, control: PropagateControl,
+                          budget: int) -> list[list[int]]:
+        # ----------------------------------------------------------------------
+        # Unassigned constraints whose conditions are all guessed
+        # ----------------------------------------------------------------------
+        candidates: list[tuple[int, list[int]]] = []
+        for cid in self.lpsolver.get_implied_candidates():
+            if control.assignment.value(self.cids_sid[cid]) is not None:
+                continue
+            if not self.__cid_completed(cid):
+                continue
+            condids: list[int] = [
+                condid
+                for condid in self.cids[cid]
+                if self.cids_value[condid]
+            ]
+            candidates.append((cid, condids))
+        # ----------------------------------------------------------------------
+        # Compute the reasons of the implied literals
+        # ----------------------------------------------------------------------
+        reasons: list[list[int]] = []
+        for conflict in self.lpsolver.propagate_implied(candidates, budget):
+            reasons.append(self.__nogoods_exists(conflict))
+        return reasons
+
     # ==========================================================================
     # Nogoods refiners
     # ==========================================================================
@@ -344,7 +742,7 @@ class LpChecker:
         # ----------------------------------------------------------------------
         sid: int = self.cids_sid[cid]
         nogood.add(sid)
-        for condid in self.cids[cid]:
+        for condid in self.cids_nogood[cid]:
             scondid: int = self.cids_sid[condid]
             if not self.cids_guess[condid] or not self.cids_value[condid]:
                 nogood.add(-scondid)
@@ -355,7 +753,7 @@ class LpChecker:
         # 1) A condid of a guessed true constraints should be changed
         # ----------------------------------------------------------------------
         for p_cid in prop_cids:
-            for p_condid in self.cids[p_cid]:
+            for p_condid in self.cids_nogood[p_cid]:
                 assert self.cids_guess[p_condid]
                 p_scondid: int = self.cids_sid[p_condid]
                 if not self.cids_value[p_condid]:
@@ -369,7 +767,7 @@ class LpChecker:
             assert self.cids_guess[up_cid]
             up_sid: int = self.cids_sid[up_cid]
             nogood.add(-up_sid)
-        return list(nogood)
+        return self.__unfixed(list(nogood))
 
     def __nogoods_exists(self: LpChecker, cids: list[int]) -> list[int]:
         nogood: list[int] = []
@@ -379,18 +777,33 @@ class LpChecker:
             sid: int = self.cids_sid[cid]
             nogood.append(sign * sid)
             if sign == 1:
-                for condid in self.cids[cid]:
+                for condid in self.cids_nogood[cid]:
                     scondid: int = self.cids_sid[condid]
                     assert self.cids_guess[condid]
                     if self.cids_value[condid]:
                         nogood.append(scondid)
                     else:
                         nogood.append(-scondid)
-        return nogood
+        return self.__unfixed(nogood)
+
+    def __unfixed(self: LpChecker, nogood: list[int]) -> list[int]:
+        # ----------------------------------------------------------------------
+        # Literals fixed to true are always part of the nogood: remove them
+        # ----------------------------------------------------------------------
+        if len(self.sids_fixed) == 0:
+            return nogood
+        return [sid for sid in nogood if sid not in self.sids_fixed]
 
     # ==========================================================================
     # Getters
     # ==========================================================================
+    def __cid_fixed(self: LpChecker, cid: int) -> bool:
+        for cid_ in [cid] + self.cids[cid]:
+            sid: int = self.cids_sid[cid_]
+            if sid not in self.sids_fixed and -sid not in self.sids_fixed:
+                return False
+        return True
+
     def __cid_completed(self: LpChecker, cid: int) -> bool:
         for condid in self.cids[cid]:
             if not self.cids_guess[condid]:
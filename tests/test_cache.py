@@ -0,0 +1,96 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+from merrinasp.theory.lra.cache import VALUES_MAX, WITNESSES_MAX, LpCache
+from merrinasp.theory.lra.logger import Logger
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+def test_core_hits() -> None:
+    # --------------------------------------------------------------------------
+    # Only the hits of the entries inserted from cores are counted, until a
+    # smaller entry replaces them
+    # --------------------------------------------------------------------------
+    cache: LpCache = LpCache()
+    cache.add([1, 2], None, False, is_core=True)
+    cache.add([3, 4], None, False)
+    cache.add([5], 7, False, is_core=True)
+    assert cache.check([1, 2, 3], None) is False
+    assert cache.check([3, 4, 5], None) is False
+    assert cache.check([5], 7) is False
+    assert cache.core_hits == 2
+    cache.add([1], None, False)
+    assert cache.check([1, 2], None) is False
+    assert cache.core_hits == 2
+
+
+def test_core_hits_merge() -> None:
+    # ~ The hits are counted per partition and summed
+    loggers: list[Logger] = [Logger('p'), Logger('q')]
+    loggers[0].cache_core_hits = 2
+    loggers[1].cache_core_hits = 3
+    statistics: dict = Logger.merge(loggers)
+    assert statistics['LP Solver']['Lp Cache']['Core hits'] == 5
+
+
+def test_value_borders() -> None:
+    # --------------------------------------------------------------------------
+    # The minimum over {1, 2} bounds the minima over its supersets from below
+    # and over its subsets from above, for the same objective only
+    # --------------------------------------------------------------------------
+    cache: LpCache = LpCache()
+    cache.add_value([1, 2], 7, 5.)
+    assert cache.check_value([1, 2, 3], 7, 4.) is True
+    assert cache.check_value([1], 7, 6.) is False
+    assert cache.check_value([1, 2, 3], 7, 6.) is None
+    assert cache.check_value([1], 7, 4.) is None
+    assert cache.check_value([1, 2, 3], 8, 4.) is None
+    # --------------------------------------------------------------------------
+    # Unbounded minima refute any bound on the subsets
+    # --------------------------------------------------------------------------
+    cache.add_value([4, 5], 7, -float('inf'))
+    assert cache.check_value([4], 7, -10**9) is False
+
+
+def test_value_borders_size() -> None:
+    # ~ The oldest entries are dropped first
+    cache: LpCache = LpCache()
+    for i in range(VALUES_MAX + 1):
+        cache.add_value([i], 7, 1.)
+    assert cache.check_value([0], 7, 1.) is None
+    assert cache.check_value([1], 7, 1.) is True
+    assert cache.check_value([VALUES_MAX], 7, 1.) is True
+
+
+def test_witness_borders() -> None:
+    # --------------------------------------------------------------------------
+    # The witnesses follow the SAT border entries: a superset entry replaces
+    # the witness of its subsets, the newest witnesses come first
+    # --------------------------------------------------------------------------
+    cache: LpCache = LpCache()
+    cache.add([1], None, True, witness={'x': 1.})
+    cache.add([2], None, True, witness={'x': 2.})
+    assert cache.get_witnesses() == [{'x': 2.}, {'x': 1.}]
+    cache.add([1, 3], None, True, witness={'x': 3.})
+    assert cache.get_witnesses() == [{'x': 3.}, {'x': 2.}]
+    # ~ Entries not added to the border do not keep their witness
+    cache.add([3], None, True, witness={'x': 4.})
+    cache.add([4], None, False, witness={'x': 5.})
+    assert cache.get_witnesses() == [{'x': 3.}, {'x': 2.}]
+
+
+def test_witness_borders_size() -> None:
+    cache: LpCache = LpCache()
+    for i in range(WITNESSES_MAX + 1):
+        cache.add([i], None, True, witness={'x': float(i)})
+    witnesses: list[dict[str, float]] = cache.get_witnesses()
+    assert len(witnesses) == WITNESSES_MAX
+    assert {'x': 0.} not in witnesses
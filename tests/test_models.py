@@ -0,0 +1,137 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+from itertools import permutations
+
+import pytest
+
+from merrinasp.theory.language import LpConstraint
+from merrinasp.theory.lra.cache import LpCache
+from merrinasp.theory.lra.models import ModelGLPK, ModelInterface
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+@pytest.mark.parametrize('permutation', list(permutations([1, 2, 3])))
+def test_clone_permuted_mapping(permutation: tuple[int, ...]) -> None:
+    # --------------------------------------------------------------------------
+    # Template rows: x >= 1, x >= 2 and x >= 3 (with distinct descriptions)
+    # --------------------------------------------------------------------------
+    template: ModelInterface = ModelGLPK('glpk', 'template', cache=LpCache())
+    template.update([
+        (cid, ('exists', [(1.0, 'x')], '>=', float(cid)), cid)
+        for cid in (1, 2, 3)
+    ])
+    cids: dict[int, int] = dict(zip((1, 2, 3), permutation))
+    model: ModelInterface = template.clone('clone', cids)
+    # --------------------------------------------------------------------------
+    # Each new constraint identifier removes the row it was mapped on: only
+    # the row mapped on the kept identifier bounds x from below
+    # --------------------------------------------------------------------------
+    for cid, cid_ in cids.items():
+        assert model.rows[cid_] == template.rows[cid]
+    model.update([(4, ('exists', [(1.0, 'x')], '<=', 1.5), 4)])
+    kept: int = permutation[0]
+    model.remove([cid_ for cid_ in permutation if cid_ != kept])
+    assert model.check_exists()
+
+
+def test_decompose_components() -> None:
+    # --------------------------------------------------------------------------
+    # Rows over x (feasible) and over y (infeasible): each component is
+    # solved alone and cached with its own result
+    # --------------------------------------------------------------------------
+    cache: LpCache = LpCache()
+    model: ModelInterface = ModelGLPK('glpk', 'p', cache=cache)
+    model.decompose = True
+    model.update([
+        (1, ('exists', [(1.0, 'x')], '>=', 1.0), 1),
+        (2, ('exists', [(1.0, 'x')], '<=', 2.0), 2),
+        (3, ('exists', [(1.0, 'y')], '>=', 3.0), 3),
+        (4, ('exists', [(1.0, 'y')], '<=', 2.0), 4)
+    ])
+    assert not model.check_exists()
+    assert model.unsat_component == {3, 4}
+    assert cache.check([1, 2], None) is True
+    assert cache.check([3, 4], None) is False
+    assert cache.check([1, 3, 4], None) is False
+
+
+@pytest.mark.parametrize('bound, is_valid', [(3.0, True), (5.0, False)])
+def test_dualize_forall(bound: float, is_valid: bool) -> None:
+    # --------------------------------------------------------------------------
+    # min x + y = 4 over x >= 1, y >= 3: a valid forall constraint is proved
+    # by one feasibility LP holding the rows of the partition and of the dual
+    # --------------------------------------------------------------------------
+    model: ModelInterface = ModelGLPK('glpk', 'p', cache=LpCache())
+    model.dualize = True
+    model.update([
+        (1, ('exists', [(1.0, 'x')], '>=', 1.0), 1),
+        (2, ('exists', [(1.0, 'y')], '>=', 3.0), 2),
+        (3, ('forall', [(1.0, 'x'), (1.0, 'y')], '>=', bound), 3)
+    ])
+    assert model.check_forall() == ([] if is_valid else [3])
+    assert model.logger.lpsolver_calls_nb == (1 if is_valid else 2)
+    assert set(model.get_assignment()) == {'x', 'y'}
+
+
+def test_propagate_implied() -> None:
+    # --------------------------------------------------------------------------
+    # Over x >= 5: x <= 3 is implied false (reason: x >= 5) while the
+    # entailed x <= 20 stays unassigned
+    # --------------------------------------------------------------------------
+    model: ModelInterface = ModelGLPK('glpk', 'p', cache=LpCache())
+    model.update([(1, ('exists', [(1.0, 'x')], '>=', 5.0), 1)])
+    implied: list[list[int]] = model.propagate_implied([
+        [(2, ('exists', [(1.0, 'x')], '<=', 3.0), 2)],
+        [(3, ('exists', [(1.0, 'x')], '<=', 20.0), 3)]
+    ], 0)
+    assert implied == [[1, 2]]
+    assert model.logger.propagations == 1
+
+
+def test_propagate_implied_lp() -> None:
+    # --------------------------------------------------------------------------
+    # Over x + y >= 5 and y <= 1: x <= 3 is only refuted by a bound LP,
+    # within the budget of LP calls
+    # --------------------------------------------------------------------------
+    model: ModelInterface = ModelGLPK('glpk', 'p', cache=LpCache())
+    model.update([
+        (1, ('exists', [(1.0, 'x'), (1.0, 'y')], '>=', 5.0), 1),
+        (2, ('exists', [(1.0, 'y')], '<=', 1.0), 2)
+    ])
+    candidates: list[list[tuple[int, LpConstraint, int]]] = [
+        [(3, ('exists', [(1.0, 'x')], '<=', 3.0), 3)]
+    ]
+    assert model.propagate_implied(candidates, 0) == []
+    implied: list[list[int]] = model.propagate_implied(candidates, 2)
+    assert len(implied) == 1
+    assert sorted(implied[0]) == [1, 2, 3]
+    assert len(model.constraints) == 2
+
+
+def test_witness_store() -> None:
+    # --------------------------------------------------------------------------
+    # The point found for x >= 1, x <= 10 answers x >= 1 in another
+    # partition without solving
+    # --------------------------------------------------------------------------
+    cache: LpCache = LpCache()
+    model: ModelInterface = ModelGLPK('glpk', 'p', cache=cache)
+    model.witness_store = True
+    model.update([
+        (1, ('exists', [(1.0, 'x')], '>=', 1.0), 1),
+        (2, ('exists', [(1.0, 'x')], '<=', 10.0), 2)
+    ])
+    assert model.check_exists()
+    model_: ModelInterface = ModelGLPK('glpk', 'q', cache=cache)
+    model_.witness_store = True
+    model_.update([(3, ('exists', [(1.0, 'x')], '>=', 1.0), 3)])
+    assert model_.check_exists()
+    assert model_.logger.witness_hits_nb == 1
+    assert model_.logger.lpsolver_calls_nb == 0
@@ -0,0 +1,41 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+from merrinasp.theory.lra.nogoods import NogoodStore
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+def test_duplicates() -> None:
+    # ~ The order and the repetitions of the literals do not matter
+    store: NogoodStore = NogoodStore()
+    assert store.add([3, -1, 2])
+    assert not store.add([2, 3, -1])
+    assert not store.add([-1, -1, 2, 3])
+    assert store.added_nb == 1
+    assert store.duplicates_nb == 2
+    assert store.subsumed_nb == 0
+
+
+def test_subsumption() -> None:
+    # --------------------------------------------------------------------------
+    # A superset of an added nogood is skipped, whatever its smallest literal,
+    # but a subset of an added nogood is kept
+    # --------------------------------------------------------------------------
+    store: NogoodStore = NogoodStore()
+    assert store.add([2, 5])
+    assert not store.add([2, 4, 5])
+    assert not store.add([-7, 2, 5])
+    assert store.add([2, -5])
+    assert store.add([5])
+    assert not store.add([1, 5, 9])
+    assert store.added_nb == 3
+    assert store.duplicates_nb == 0
+    assert store.subsumed_nb == 3
@@ -0,0 +1,433 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+
+import pytest
+from clingo import Control, Model
+
+from merrinasp.theory.language import THEORY_LANGUAGE, rewrite
+from merrinasp.theory.propagator import LpPropagator
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+
+EXAMPLES: Path = Path(__file__).resolve().parents[1] / 'examples'
+
+MERRIN_ARGUMENTS: list[str] = [
+    '--project', '--opt-strategy=usc', '--heuristic=Domain',
+    '-c', 'bounded_nonreach=0', '--enum-mode=domRec', '--dom-mod=5,16',
+    '--opt-mode=optN'
+]
+
+# ~ Options of the propagator and their value when enabled
+OPTIONS: list[tuple[str, Any]] = [
+    ('lazy', True),
+    ('adaptive_watches', True),
+    ('lock_nogoods', False),
+    ('minimize_nogoods', True),
+    ('partition_templates', True),
+    ('model_pool', 4),
+    ('decompose_partitions', True),
+    ('nullspace_presolve', True),
+    ('batch_forall', True),
+    ('dualize_forall', True),
+    ('witness_store', True),
+    ('incremental_check', True),
+    ('symmetric_partitions', True),
+    ('batch_partitions', 64),
+    ('lp_propagation', 2),
+    ('partial_exists_check', 2),
+    ('check_policy', ('every', 4)),
+    ('check_policy', ('level', 0)),
+    ('check_policy', ('budget', 0.)),
+    ('check_policy', ('adaptive', 0))
+]
+
+# ~ Check policies skipping checks at partial assignments (policy, parameter)
+POLICIES: list[tuple[str, float]] = [
+    ('every', 4),
+    ('level', 0),
+    ('budget', 0.),
+    ('adaptive', 0)
+]
+
+# ~ Independent components in one partition
+COMPONENTS: str = """
+{ a; b; c; d }.
+&dom(p){0..10} = x.
+&dom(p){0..10} = y.
+&dom(p){0..10} = z.
+&sum(p){x} >= 5 :- a.
+&sum(p){x} <= 3 :- b.
+&sum(p){y; z} >= 4 :- c.
+&sum(p){y; -z} >= 12 :- d.
+&sum(p){z} <= 1 :- c.
+"""
+
+# ~ Partitions equal up to the arguments of their identifiers
+SYMMETRIC: str = """
+t(1..4).
+{ a(T) } :- t(T).
+{ b(T) } :- t(T).
+&dom(w(T)){0..10} = x(T,"a,1") :- t(T).
+&dom(w(T)){0..10} = y(T) :- t(T).
+&sum(w(T)){x(T,"a,1"); y(T)} >= 12 :- a(T).
+&sum(w(T)){x(T,"a,1"); -y(T)} >= 3 :- b(T).
+&sum(w(T)){y(T)} >= 8 :- b(T).
+&assert(w(T)){x(T,"a,1")} >= 1 :- t(T).
+"""
+
+# ~ Several forall constraints in one partition
+FORALLS: str = """
+{ a; b; c }.
+&dom(p){0..10} = x.
+&dom(p){0..10} = y.
+&sum(p){x; y} >= 4 :- a.
+&sum(p){x} >= 1 :- b.
+&sum(p){y} >= 1 :- c.
+&assert(p){x} >= 0.
+&assert(p){y} >= 0.
+&assert(p){x; y} >= 2.
+&assert(p){x; -y} >= -9.
+"""
+
+# ~ Forall constraint independent from the conditions of a row
+UNCONNECTED: str = """
+{ a; b; c; d; e }.
+&dom(p){0..10} = x.
+&dom(p){0..10} = y.
+&sum(p){x} >= 2 :- a.
+&sum(p){y} >= 1 :- b.
+&sum(p){y: c; 2*y: d; -y: e} <= 8.
+&assert(p){x} >= 1.
+"""
+
+# ~ Large partition emptied on backtracking
+TEMPLATE: str = """
+i(1..40).
+{ a; b }.
+&sum(p){x(I)} >= I :- a, i(I).
+&sum(p){x(I)} <= 50 :- a, b, i(I).
+"""
+
+# ==============================================================================
+# Auxiliary functions
+# ==============================================================================
+
+
+def solve(files: list[Path], arguments: list[str] | None = None,
+          **options: Any) -> tuple[set[frozenset[str]], LpPropagator]:
+    # --------------------------------------------------------------------------
+    # Same defaults as the application, then the tested options
+    # --------------------------------------------------------------------------
+    propagator: LpPropagator = LpPropagator()
+    propagator.strict_forall_check(True)
+    for option, value in options.items():
+        values: tuple = value if isinstance(value, tuple) else (value,)
+        getattr(propagator, option)(*values)
+    control: Control = Control(['0'] + (arguments or []))
+    control.register_propagator(propagator)  # type: ignore
+    control.add('base', [], THEORY_LANGUAGE)
+    rewrite(control, [str(file) for file in files])
+    control.ground([('base', [])])
+    # --------------------------------------------------------------------------
+    # Shown atoms of the (optimal) models
+    # --------------------------------------------------------------------------
+    models: set[frozenset[str]] = set()
+
+    def on_model(model: Model) -> None:
+        if len(model.cost) == 0 or model.optimality_proven:
+            models.add(frozenset(
+                str(symbol) for symbol in model.symbols(shown=True)
+            ))
+    control.solve(on_model=on_model)
+    return models, propagator
+
+
+def solve_backtrack(statistic: str, **options: Any) -> list[float]:
+    # ~ The statistics of the removed partitions are read at each model
+    propagator: LpPropagator = LpPropagator()
+    for option, value in options.items():
+        getattr(propagator, option)(value)
+    control: Control = Control(['0'])
+    control.register_propagator(propagator)  # type: ignore
+    control.add('base', [], THEORY_LANGUAGE)
+    control.add('base', [], TEMPLATE)
+    control.ground([('base', [])])
+    values: list[float] = []
+    control.solve(on_model=lambda _: values.append(get_statistic(
+        propagator, 'LP Solver', 'Modifications', statistic
+    )))
+    return values
+
+
+def write_program(directory: Path, program: str) -> Path:
+    path: Path = directory / 'program.lp'
+    path.write_text(program)
+    return path
+
+
+def get_statistic(propagator: LpPropagator, *keys: str) -> float:
+    statistics: Any = propagator.get_statistics()
+    for key in keys:
+        statistics = statistics[key]
+    return statistics
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+@pytest.mark.parametrize('option, value', OPTIONS)
+@pytest.mark.parametrize('example', sorted(EXAMPLES.glob('*.lp')),
+                         ids=lambda path: path.stem)
+def test_option_examples(example: Path, option: str, value: Any) -> None:
+    models, _ = solve([example])
+    models_, _ = solve([example], **{option: value})
+    assert models_ == models
+
+
+@pytest.mark.parametrize('option, value', OPTIONS)
+def test_option_components(tmp_path: Path, option: str, value: Any) -> None:
+    program: Path = write_program(tmp_path, COMPONENTS)
+    models, _ = solve([program])
+    models_, _ = solve([program], **{option: value})
+    assert models_ == models
+
+
+@pytest.mark.parametrize('option, value', OPTIONS)
+def test_option_symmetric(tmp_path: Path, option: str, value: Any) -> None:
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, _ = solve([program])
+    models_, _ = solve([program], **{option: value})
+    assert models_ == models
+
+
+def test_decompose(tmp_path: Path) -> None:
+    program: Path = write_program(tmp_path, COMPONENTS)
+    models, _ = solve([program])
+    models_, _ = solve([program], decompose_partitions=True)
+    assert models_ == models
+    assert len(models) == 6
+
+
+def test_partial_exists_check(tmp_path: Path) -> None:
+    # ~ The exists rows are checked before the partition is fully assigned
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, propagator = solve([program])
+    models_, propagator_ = solve([program], partial_exists_check=2)
+    assert models_ == models
+    keys: tuple[str, ...] = ('LP Solver', 'Solving', 'Partial checks')
+    assert get_statistic(propagator, *keys) == 0
+    assert get_statistic(propagator_, *keys) != 0
+
+
+def test_symmetric_partitions(tmp_path: Path) -> None:
+    # ~ The partitions with the same rows up to renaming share their checks
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, propagator = solve([program])
+    models_, propagator_ = solve([program], symmetric_partitions=True)
+    assert models_ == models
+    keys: tuple[str, ...] = ('LP Solver', 'Solving', 'Calls')
+    assert get_statistic(propagator_, *keys) \
+        < get_statistic(propagator, *keys)
+
+
+@pytest.mark.parametrize('is_locked', [False, True])
+def test_lock_nogoods(tmp_path: Path, is_locked: bool) -> None:
+    # ~ Only the locked nogoods are stored and filtered for duplicates
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, _ = solve([program])
+    models_, propagator = solve([program], lock_nogoods=is_locked)
+    assert models_ == models
+    added: float = get_statistic(propagator, 'Nogoods', 'Added')
+    duplicates: float = get_statistic(propagator, 'Nogoods', 'Duplicates')
+    assert (added != 0) == is_locked
+    assert (duplicates != 0) == is_locked
+
+
+def test_incremental_check(tmp_path: Path) -> None:
+    # ~ The rows kept between the lazy checks are not checked again
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, propagator = solve([program], lazy=True)
+    models_, propagator_ = solve(
+        [program], lazy=True, incremental_check=True
+    )
+    assert models_ == models
+    keys: tuple[str, ...] = ('LP Solver', 'Lp Cache', 'Cache guesses')
+    assert get_statistic(propagator_, *keys) \
+        < get_statistic(propagator, *keys)
+
+
+@pytest.mark.parametrize('is_shared', [False, True])
+def test_share_conflicts(tmp_path: Path, is_shared: bool) -> None:
+    # ~ The conflicts of a thread are sent to the queues of the others
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, _ = solve([program])
+    models_, propagator = solve(
+        [program], ['-t', '4'], share_conflicts=is_shared
+    )
+    assert models_ == models
+    shared: float = get_statistic(propagator, 'Nogoods', 'Shared')
+    assert (shared != 0) == is_shared
+
+
+@pytest.mark.parametrize('policy', POLICIES, ids=lambda policy: policy[0])
+def test_check_policy(tmp_path: Path, policy: tuple[str, float]) -> None:
+    # ~ Fewer checks at partial assignments, the total ones are all checked
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, propagator = solve([program])
+    models_, propagator_ = solve([program], check_policy=policy)
+    assert models_ == models
+    assert get_statistic(propagator, 'Scheduler', 'Skipped') == 0
+    assert get_statistic(propagator_, 'Scheduler', 'Skipped') != 0
+    assert get_statistic(propagator_, 'Scheduler', 'Checks') \
+        < get_statistic(propagator, 'Scheduler', 'Checks')
+
+
+def test_lp_propagation(tmp_path: Path) -> None:
+    # ~ The atoms whose rows conflict with the active rows are implied false
+    program: Path = write_program(tmp_path, COMPONENTS)
+    models, _ = solve([program])
+    models_, propagator = solve([program], lp_propagation=2)
+    assert models_ == models
+    assert get_statistic(propagator, 'Propagations') != 0
+
+
+def test_batch_partitions(tmp_path: Path) -> None:
+    program: Path = write_program(tmp_path, SYMMETRIC)
+    models, _ = solve([program])
+    models_, propagator = solve([program], batch_partitions=64)
+    assert models_ == models
+    # ~ Each stacked LP checks several partitions
+    checks: float = get_statistic(
+        propagator, 'LP Solver', 'Solving', 'Batched checks'
+    )
+    lps: float = get_statistic(
+        propagator, 'LP Solver', 'Solving', 'Batched LPs'
+    )
+    assert 0 < lps < checks
+
+
+def test_minimize_nogoods(tmp_path: Path) -> None:
+    # ~ The forall conflicts skip the conditions of the rows over y: one
+    #   conflict covers all their values
+    program: Path = write_program(tmp_path, UNCONNECTED)
+    models, propagator = solve([program])
+    models_, propagator_ = solve([program], minimize_nogoods=True)
+    assert models_ == models
+    assert get_statistic(propagator_, 'Conflicts', 'Forall') \
+        < get_statistic(propagator, 'Conflicts', 'Forall')
+
+
+def test_batch_forall(tmp_path: Path) -> None:
+    # ~ The objectives after the first one are re-optimized from its basis
+    program: Path = write_program(tmp_path, FORALLS)
+    models, _ = solve([program])
+    models_, propagator = solve([program], batch_forall=True)
+    assert models_ == models
+    assert len(models) == 3
+    assert get_statistic(
+        propagator, 'LP Solver', 'Solving', 'Re-optimizations'
+    ) != 0
+
+
+def test_templates_backtrack() -> None:
+    # --------------------------------------------------------------------------
+    # The partition is removed when its rows are undone and rebuilt from a
+    # clone of its own template
+    # --------------------------------------------------------------------------
+    clones: list[float] = solve_backtrack('Clones', partition_templates=True)
+    assert len(clones) == 4
+    assert max(clones) != 0
+
+
+@pytest.mark.parametrize('size', [0, 4])
+def test_model_pool(size: int) -> None:
+    # --------------------------------------------------------------------------
+    # The model of the removed partition is kept in the pool and reset when
+    # the partition is rebuilt
+    # --------------------------------------------------------------------------
+    reuses: list[float] = solve_backtrack('Reuses', model_pool=size)
+    assert len(reuses) == 4
+    assert (max(reuses) != 0) == (size != 0)
+
+# ------------------------------------------------------------------------------
+# Merrin examples: larger partitions (templates, presolve and dual checks)
+# ------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope='module')
+def rfba() -> tuple[list[Path], set[frozenset[str]]]:
+    files: list[Path] = [
+        EXAMPLES / 'merrin' / 'model_merrin.lp',
+        EXAMPLES / 'merrin' / 'model_rfba.lp',
+        EXAMPLES / 'merrin' / 'data' / 'data_covert_kfp_100.lp'
+    ]
+    models, _ = solve(files, MERRIN_ARGUMENTS)
+    return files, models
+
+
+@pytest.fixture(scope='module')
+def rfba_dual() -> tuple[list[Path], set[frozenset[str]]]:
+    files: list[Path] = [
+        EXAMPLES / 'merrin' / 'model_merrin.lp',
+        EXAMPLES / 'merrin' / 'model_rfba_dual.lp',
+        EXAMPLES / 'merrin' / 'data' / 'data_covert_f_100.lp'
+    ]
+    models, _ = solve(files, MERRIN_ARGUMENTS)
+    return files, models
+
+
+def test_rfba_templates(rfba: tuple[list[Path], set[frozenset[str]]]) -> None:
+    # ~ The clones map the template rows on permuted constraint identifiers
+    files, models = rfba
+    models_, propagator = solve(
+        files, MERRIN_ARGUMENTS, partition_templates=True
+    )
+    assert models_ == models
+    assert get_statistic(
+        propagator, 'LP Solver', 'Modifications', 'Clones'
+    ) != 0
+
+
+def test_rfba_presolve(rfba: tuple[list[Path], set[frozenset[str]]]) -> None:
+    files, models = rfba
+    models_, propagator = solve(
+        files, MERRIN_ARGUMENTS, nullspace_presolve=True
+    )
+    assert models_ == models
+    assert get_statistic(
+        propagator, 'LP Solver', 'Modifications', 'Eliminated rows'
+    ) != 0
+
+
+def test_rfba_batch_partitions(
+        rfba: tuple[list[Path], set[frozenset[str]]]) -> None:
+    files, models = rfba
+    models_, propagator = solve(files, MERRIN_ARGUMENTS, batch_partitions=64)
+    assert models_ == models
+    assert get_statistic(
+        propagator, 'LP Solver', 'Solving', 'Batched checks'
+    ) != 0
+
+
+def test_rfba_decompose(rfba: tuple[list[Path], set[frozenset[str]]]) -> None:
+    files, models = rfba
+    models_, _ = solve(files, MERRIN_ARGUMENTS, decompose_partitions=True)
+    assert models_ == models
+
+
+@pytest.mark.parametrize('option', ['dualize_forall', 'batch_forall'])
+def test_rfba_dual(rfba_dual: tuple[list[Path], set[frozenset[str]]],
+                   option: str) -> None:
+    files, models = rfba_dual
+    models_, _ = solve(files, MERRIN_ARGUMENTS, **{option: True})
+    assert models_ == models
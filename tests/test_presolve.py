@@ -0,0 +1,109 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+import pytest
+
+from merrinasp.theory.lra.presolve import (
+    Row,
+    Substitution,
+    nullspace_substitution
+)
+
+# ==============================================================================
+# Auxiliary functions
+# ==============================================================================
+
+
+def substitute(substitution: Substitution,
+               values: dict[str, float]) -> dict[str, float]:
+    values_: dict[str, float] = dict(values)
+    for pivot, (offset, expr) in substitution.items():
+        values_[pivot] = offset + sum(
+            coeff * values[var] for coeff, var in expr
+        )
+    return values_
+
+
+def activity(row: Row, values: dict[str, float]) -> float:
+    expr, _, _ = row
+    return sum(coeff * values[var] for coeff, var in expr)
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+def test_substitution() -> None:
+    # --------------------------------------------------------------------------
+    # The pivots are expressed with the free variables only: any value of
+    # the free variables satisfies every row
+    # --------------------------------------------------------------------------
+    rows: list[Row] = [
+        ([(1., 'x'), (1., 'y')], '=', 3.),
+        ([(1., 'y'), (-1., 'z')], '=', 1.),
+        ([(2., 'z'), (1., 'w'), (1., 'x')], '=', 0.)
+    ]
+    presolved: tuple[Substitution, set[int]] | None = \
+        nullspace_substitution(rows)
+    assert presolved is not None
+    substitution, eliminated = presolved
+    assert eliminated == {0, 1, 2}
+    assert len(substitution) == 3
+    free: set[str] = {'x', 'y', 'z', 'w'} - set(substitution)
+    for _, expr in substitution.values():
+        assert {var for _, var in expr} <= free
+    for value in (-2., 0., 5.):
+        values: dict[str, float] = substitute(
+            substitution, {var: value for var in free}
+        )
+        for row in rows:
+            assert activity(row, values) == pytest.approx(row[2])
+
+
+def test_redundant_rows() -> None:
+    # ~ A combination of the pivot rows is eliminated without any pivot
+    rows: list[Row] = [
+        ([(1., 'x'), (1., 'y')], '=', 3.),
+        ([(2., 'x'), (2., 'y')], '=', 6.)
+    ]
+    presolved: tuple[Substitution, set[int]] | None = \
+        nullspace_substitution(rows)
+    assert presolved is not None
+    substitution, eliminated = presolved
+    assert eliminated == {0, 1}
+    assert len(substitution) == 1
+
+
+def test_inconsistent_rows() -> None:
+    # ~ Left to the LP solver
+    rows: list[Row] = [
+        ([(1., 'x'), (1., 'y')], '=', 3.),
+        ([(1., 'x'), (1., 'y')], '=', 4.)
+    ]
+    assert nullspace_substitution(rows) is None
+
+
+def test_stable_pivot() -> None:
+    # ~ The small coefficients are never pivots
+    rows: list[Row] = [([(10**-3, 'x'), (1., 'y')], '=', 1.)]
+    presolved: tuple[Substitution, set[int]] | None = \
+        nullspace_substitution(rows)
+    assert presolved is not None
+    substitution, _ = presolved
+    assert set(substitution) == {'y'}
+
+
+def test_dense_rows() -> None:
+    # ~ Pivots of dense rows and columns fill too many entries: kept in the LP
+    variables: list[str] = [f'x{j}' for j in range(6)]
+    rows: list[Row] = [
+        ([(float(i + j + 1), var) for j, var in enumerate(variables)],
+         '=', float(i))
+        for i in range(6)
+    ]
+    assert nullspace_substitution(rows) is None
@@ -0,0 +1,40 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+from clingo import Control
+
+from merrinasp.theory.language import THEORY_LANGUAGE
+from merrinasp.theory.propagator import LpPropagator
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+def solve(propagator: LpPropagator, program: str) -> list[set[str]]:
+    control: Control = Control(['0'])
+    control.register_propagator(propagator)  # type: ignore
+    control.add('base', [], THEORY_LANGUAGE)
+    control.add('base', [], program)
+    control.ground([('base', [])])
+    models: list[set[str]] = []
+    control.solve(on_model=lambda model: models.append(
+        {str(symbol) for symbol in model.symbols(atoms=True)}
+    ))
+    return models
+
+
+def test_add_clause_before_init() -> None:
+    # --------------------------------------------------------------------------
+    # Clauses added before init are kept until the atoms are mapped
+    # --------------------------------------------------------------------------
+    propagator: LpPropagator = LpPropagator()
+    propagator.add_clause([('a', True), ('b', True)])
+    models: list[set[str]] = solve(propagator, '{a; b}.')
+    assert len(models) == 3
+    assert all('a' in model or 'b' in model for model in models)
@@ -0,0 +1,40 @@
+# -*- coding=utf-8 -*-
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+from __future__ import annotations
+
+import pytest
+
+from merrinasp.theory.lra.logger import Logger
+from merrinasp.theory.lra.scheduler import (
+    WATCHES_MIN_CALLS,
+    WATCHES_MIN_COST,
+    is_lazy_partition
+)
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+
+
+@pytest.mark.parametrize('calls, cost, conflicts, is_lazy', [
+    (WATCHES_MIN_CALLS - 1, 2 * WATCHES_MIN_COST, 0, False),
+    (WATCHES_MIN_CALLS, WATCHES_MIN_COST / 2, 0, False),
+    (WATCHES_MIN_CALLS, 2 * WATCHES_MIN_COST, WATCHES_MIN_CALLS, False),
+    (WATCHES_MIN_CALLS, 2 * WATCHES_MIN_COST, 0, True)
+])
+def test_lazy_partition(calls: int, cost: float, conflicts: int,
+                        is_lazy: bool) -> None:
+    # --------------------------------------------------------------------------
+    # Only the partitions with enough costly LPs and no conflicts stop being
+    # watched
+    # --------------------------------------------------------------------------
+    logger: Logger = Logger('p')
+    logger.lpsolver_calls_nb = calls
+    logger.lpsolver_calls_sum = calls * cost
+    logger.conflicts_exists = conflicts
+    assert is_lazy_partition(logger) == is_lazy
+    assert not is_lazy_partition(None)